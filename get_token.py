@@ -4,8 +4,13 @@ Simple script to get your Plex authentication token
 """
 import getpass
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
+# Shared session so any further plex.tv calls reuse the same TLS connection
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
 def get_plex_token():
     print("Plex Token Retrieval")
     print("=" * 50)
@@ -15,7 +20,7 @@ def get_plex_token():
     print("\nAuthenticating with Plex...")
 
     try:
-        response = requests.post(
+        response = SESSION.post(
             'https://plex.tv/users/sign_in.json',
             headers={
                 'Content-Type': 'application/x-www-form-urlencoded',
@@ -1,12 +1,40 @@
 """PlexClient protocol and implementation for async Plex API operations."""
 
 import asyncio
+import functools
+import operator
 import os
-from typing import Protocol, Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Protocol, Any, Callable, Dict, List, Optional, TypeVar
 
 from plexapi.server import PlexServer
 from plexapi.myplex import MyPlexAccount
 
+T = TypeVar("T")
+
+# Shared worker threads for blocking plexapi calls. Keeping them apart from
+# the loop's default executor bounds concurrent requests to the Plex server
+# and keeps its threads warm between calls.
+_PLEX_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="plexapi")
+
+_SECTION_FIELDS = ("key", "title", "type", "locations")
+_section_attrs = operator.attrgetter(*_SECTION_FIELDS)
+
+
+def _loaded_attr(obj: Any, name: str) -> Any:
+    """Read an attribute as loaded, without plexapi's auto-reload.
+
+    plexapi objects from listings are partial: reading an attribute whose
+    value is None (e.g. an item with no year) makes __getattribute__ fetch
+    the full object from the server. Reading the instance dict returns
+    what the listing already provided instead of costing one HTTP request
+    per item.
+    """
+    try:
+        return vars(obj)[name]
+    except (KeyError, TypeError):
+        return getattr(obj, name, None)
+
 
 class PlexClient(Protocol):
     """Protocol defining the async interface for Plex operations.
@@ -121,7 +149,9 @@ class PlexAPIClient:
     """Concrete implementation of PlexClient using plexapi.
 
     This class wraps the synchronous plexapi library with async methods
-    using asyncio.to_thread() to prevent blocking the event loop.
+    that run each blocking call on a dedicated thread pool to prevent
+    blocking the event loop. Each operation is one synchronous helper, so
+    lookups and the follow-up call share a single executor hop.
     """
 
     def __init__(self, server: PlexServer):
@@ -131,138 +161,159 @@ class PlexAPIClient:
             server: Initialized PlexServer instance
         """
         self.server = server
+        self._server_info: Optional[Dict[str, Any]] = None
+        self._info_lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dispatch: Optional[Callable[..., "asyncio.Future[Any]"]] = None
 
-    async def list_libraries(self) -> List[Dict[str, Any]]:
-        """List all library sections on the Plex server."""
+    def _ensure(self) -> Callable[..., "asyncio.Future[Any]"]:
+        """Return run_in_executor bound to the serving loop and the Plex pool.
 
-        def _sync_list_libraries() -> List[Dict[str, Any]]:
-            sections = self.server.library.sections()
-            return [
-                {
-                    "key": section.key,
-                    "title": section.title,
-                    "type": section.type,
-                    "locations": section.locations,
-                }
-                for section in sections
-            ]
+        The loop is looked up on first use and kept, so each call skips
+        get_running_loop(). It is looked up again only if that loop has
+        been closed (e.g. the client outlived an asyncio.run()).
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.get_running_loop()
+            self._dispatch = functools.partial(self._loop.run_in_executor, _PLEX_POOL)
+        return self._dispatch
 
-        return await asyncio.to_thread(_sync_list_libraries)
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking plexapi call on the Plex worker pool."""
+        return await self._ensure()(func, *args)
+
+    async def list_libraries(self) -> List[Dict[str, Any]]:
+        """List all library sections on the Plex server."""
+        return await self._run(self._sync_list_libraries)
 
     async def scan_library(self, section_id: str) -> Dict[str, str]:
         """Trigger a library scan for the specified section."""
-
-        def _sync_scan_library() -> Dict[str, str]:
-            section = self.server.library.sectionByID(int(section_id))
-            section.update()
-            return {
-                "status": "success",
-                "section_id": section_id,
-            }
-
-        return await asyncio.to_thread(_sync_scan_library)
+        return await self._run(self._sync_scan_library, section_id)
 
     async def search_library(
         self, section_id: str, query: str
     ) -> List[Dict[str, Any]]:
         """Search for items in a library section."""
-
-        def _sync_search_library() -> List[Dict[str, Any]]:
-            section = self.server.library.sectionByID(int(section_id))
-            results = section.search(query)
-            return [
-                {
-                    "title": item.title,
-                    "year": getattr(item, "year", None),
-                    "type": item.type,
-                }
-                for item in results
-            ]
-
-        return await asyncio.to_thread(_sync_search_library)
+        return await self._run(self._sync_search_library, section_id, query)
 
     async def list_recent(
         self, section_id: str, limit: int = 20
     ) -> List[Dict[str, Any]]:
         """List recently added items in a library section."""
-
-        def _sync_list_recent() -> List[Dict[str, Any]]:
-            section = self.server.library.sectionByID(int(section_id))
-            results = section.recentlyAdded(maxresults=limit)
-            return [
-                {
-                    "title": item.title,
-                    "year": getattr(item, "year", None),
-                    "type": item.type,
-                    "addedAt": getattr(item, "addedAt", None),
-                }
-                for item in results
-            ]
-
-        return await asyncio.to_thread(_sync_list_recent)
+        return await self._run(self._sync_list_recent, section_id, limit)
 
     async def get_server_info(self) -> Dict[str, Any]:
-        """Get Plex server information."""
-
-        def _sync_get_server_info() -> Dict[str, Any]:
-            return {
-                "name": self.server.friendlyName,
-                "version": self.server.version,
-                "platform": self.server.platform,
-                "machineIdentifier": self.server.machineIdentifier,
-            }
+        """Get Plex server information.
 
-        return await asyncio.to_thread(_sync_get_server_info)
+        The name, version, platform and machine identifier do not change
+        while the server is up, so the first result is cached; concurrent
+        first callers share one fetch.
+        """
+        if self._server_info is None:
+            async with self._info_lock:
+                if self._server_info is None:
+                    self._server_info = await self._run(self._sync_get_server_info)
+        return dict(self._server_info)
 
     async def get_library_inventory(self, section_id: str) -> List[Dict[str, Any]]:
         """Get all TV shows with season details from a library section."""
-
-        def _sync_inventory() -> List[Dict[str, Any]]:
-            section = self.server.library.sectionByID(int(section_id))
-            results = []
-            for show in section.all():
-                seasons = show.seasons()
-                season_numbers = sorted(
-                    s.seasonNumber for s in seasons if s.seasonNumber > 0
-                )
-                episode_count = sum(
-                    len(s.episodes()) for s in seasons if s.seasonNumber > 0
-                )
-                results.append({
-                    "title": show.title,
-                    "year": getattr(show, "year", None),
-                    "rating_key": str(show.ratingKey),
-                    "seasons": season_numbers,
-                    "episode_count": episode_count,
-                })
-            return results
-
-        return await asyncio.to_thread(_sync_inventory)
+        return await self._run(self._sync_inventory, section_id)
 
     async def get_show_details(self, rating_key: str) -> Dict[str, Any]:
         """Get detailed season/episode information for a specific show."""
-
-        def _sync_show_details() -> Dict[str, Any]:
-            show = self.server.fetchItem(int(rating_key))
+        return await self._run(self._sync_show_details, rating_key)
+
+    # -------------------------------------------------------------------------
+    # Blocking helpers (run on _PLEX_POOL)
+    # -------------------------------------------------------------------------
+
+    def _sync_list_libraries(self) -> List[Dict[str, Any]]:
+        sections = self.server.library.sections()
+        return [
+            dict(zip(_SECTION_FIELDS, _section_attrs(section)))
+            for section in sections
+        ]
+
+    def _sync_scan_library(self, section_id: str) -> Dict[str, str]:
+        section = self.server.library.sectionByID(int(section_id))
+        section.update()
+        return {
+            "status": "success",
+            "section_id": section_id,
+        }
+
+    def _sync_search_library(self, section_id: str, query: str) -> List[Dict[str, Any]]:
+        section = self.server.library.sectionByID(int(section_id))
+        results = section.search(query)
+        return [
+            {
+                "title": item.title,
+                "year": _loaded_attr(item, "year"),
+                "type": item.type,
+            }
+            for item in results
+        ]
+
+    def _sync_list_recent(self, section_id: str, limit: int) -> List[Dict[str, Any]]:
+        section = self.server.library.sectionByID(int(section_id))
+        results = section.recentlyAdded(maxresults=limit)
+        return [
+            {
+                "title": item.title,
+                "year": _loaded_attr(item, "year"),
+                "type": item.type,
+                "addedAt": _loaded_attr(item, "addedAt"),
+            }
+            for item in results
+        ]
+
+    def _sync_get_server_info(self) -> Dict[str, Any]:
+        return {
+            "name": self.server.friendlyName,
+            "version": self.server.version,
+            "platform": self.server.platform,
+            "machineIdentifier": self.server.machineIdentifier,
+        }
+
+    def _sync_inventory(self, section_id: str) -> List[Dict[str, Any]]:
+        section = self.server.library.sectionByID(int(section_id))
+        results = []
+        for show in section.all():
             seasons = show.seasons()
             season_numbers = sorted(
                 s.seasonNumber for s in seasons if s.seasonNumber > 0
             )
-            episode_counts = {
-                s.seasonNumber: len(s.episodes())
-                for s in seasons
-                if s.seasonNumber > 0
-            }
-            return {
+            episode_count = sum(
+                len(s.episodes()) for s in seasons if s.seasonNumber > 0
+            )
+            results.append({
                 "title": show.title,
-                "year": getattr(show, "year", None),
+                "year": _loaded_attr(show, "year"),
                 "rating_key": str(show.ratingKey),
                 "seasons": season_numbers,
-                "episode_counts": episode_counts,
-                "episode_count": sum(episode_counts.values()),
-            }
-
-        return await asyncio.to_thread(_sync_show_details)
+                "episode_count": episode_count,
+            })
+        return results
+
+    def _sync_show_details(self, rating_key: str) -> Dict[str, Any]:
+        show = self.server.fetchItem(int(rating_key))
+        seasons = show.seasons()
+        season_numbers = sorted(
+            s.seasonNumber for s in seasons if s.seasonNumber > 0
+        )
+        episode_counts = {
+            s.seasonNumber: len(s.episodes())
+            for s in seasons
+            if s.seasonNumber > 0
+        }
+        return {
+            "title": show.title,
+            "year": _loaded_attr(show, "year"),
+            "rating_key": str(show.ratingKey),
+            "seasons": season_numbers,
+            "episode_counts": episode_counts,
+            "episode_count": sum(episode_counts.values()),
+        }
 
 
 def create_plex_client(plex_url: str = None, plex_token: str = None) -> PlexAPIClient:
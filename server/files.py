@@ -3,12 +3,262 @@
 This module provides safe file operations for the Plex ingest workflow with:
 - Path restriction enforcement (PLEX_MEDIA_ROOT and PLEX_INGEST_DIR)
 - Extension whitelist for video files
-- Copy, move, rename, and delete operations
+- Copy, move, rename, and delete operations (single files or batches)
+- Kernel-side copy fast path (reflink / copy_file_range / sendfile) for large video files
 """
 
+import errno
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Set, List, Union
+from typing import Callable, Iterable, Optional, Set, List, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+# Buffer size for userspace copies (network shares, cross-device ingest).
+# shutil's 64 KiB default sits well below the throughput knee of modern
+# disks and SMB/NFS mounts.
+COPY_BUFSIZE = int(
+    os.getenv("VIDEODROME_COPY_BUFSIZE")
+    or os.getenv("PLEX_COPY_BUFSIZE")
+    or 4 * 1024 * 1024
+)
+
+# ioctl request number for FICLONE (linux/fs.h): clone src extents into dst
+FICLONE = 0x40049409
+
+# Errors meaning "this fast path is not supported here", not "the copy failed"
+_FAST_COPY_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.ENOSYS,
+    errno.EBADF,
+})
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Try to clone src into dst with FICLONE.
+
+    Returns:
+        True if the clone succeeded, False if reflinks are unsupported
+    """
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in _FAST_COPY_FALLBACK_ERRNOS:
+            return False
+        raise
+
+
+def _short_copy(name: str, size: int, remaining: int) -> OSError:
+    """Build the fallback error for a kernel copy that hit EOF early.
+
+    Some filesystems (FUSE and network mounts, procfs-like files) return 0
+    before the source's reported size has been copied. Raising a fallback
+    errno lets the caller move on to the next copy tier instead of leaving
+    a truncated destination.
+    """
+    return OSError(
+        errno.EOPNOTSUPP,
+        f"{name} stopped after {size - remaining} of {size} bytes"
+    )
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int):
+    """Copy size bytes from src to dst entirely in the kernel.
+
+    Raises:
+        OSError: If copy_file_range is unavailable, fails, or returns 0
+            before size bytes were copied
+    """
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "copy_file_range is not available")
+    remaining = size
+    while remaining > 0:
+        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+        if copied == 0:
+            raise _short_copy("copy_file_range", size, remaining)
+        remaining -= copied
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int):
+    """Copy up to size bytes from src to dst with sendfile(2).
+
+    Still an in-kernel copy, but available on kernels and filesystem pairs
+    where copy_file_range refuses (e.g. cross-device before Linux 5.3).
+
+    Raises:
+        OSError: If sendfile is unavailable, fails, or returns 0 before size
+            bytes were copied
+    """
+    if not hasattr(os, "sendfile"):
+        raise OSError(errno.ENOSYS, "sendfile is not available")
+    _fadvise(src_fd, "POSIX_FADV_SEQUENTIAL")
+    remaining = size
+    while remaining > 0:
+        sent = os.sendfile(dst_fd, src_fd, None, min(remaining, COPY_BUFSIZE))
+        if sent == 0:
+            raise _short_copy("sendfile", size, remaining)
+        remaining -= sent
+
+
+def _copyfileobj_readinto(fsrc, fdst, bufsize: int = COPY_BUFSIZE):
+    """Copy between file objects through one pre-allocated buffer.
+
+    Uses readinto() on a reusable memoryview instead of read(), avoiding a
+    new bytes allocation per chunk.
+    """
+    buf = bytearray(bufsize)
+    with memoryview(buf) as mv:
+        while True:
+            n = fsrc.readinto(mv)
+            if not n:
+                break
+            if n < bufsize:
+                with mv[:n] as chunk:
+                    fdst.write(chunk)
+            else:
+                fdst.write(mv)
+
+
+def _fadvise(fd: int, advice_name: str):
+    """Apply a posix_fadvise hint to a whole file, if the platform supports it."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _check_not_same_file(
+    src_fd: int,
+    source: Union[str, Path],
+    destination: Union[str, Path]
+):
+    """Raise shutil.SameFileError if destination is the already-open source."""
+    try:
+        dst_st = os.stat(destination)
+    except FileNotFoundError:
+        return
+    src_st = os.fstat(src_fd)
+    if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino):
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+
+
+def _buffered_copy(source: Union[str, Path], destination: Union[str, Path]):
+    """Copy a file in userspace with a large buffer.
+
+    Video files are streamed once, so the kernel is told to read ahead
+    sequentially and to drop the pages afterwards rather than evicting
+    other processes' (e.g. the Plex scanner's) cache.
+    """
+    with open(source, "rb", buffering=0) as fsrc:
+        _check_not_same_file(fsrc.fileno(), source, destination)
+        with open(destination, "wb") as fdst:
+            _fadvise(fsrc.fileno(), "POSIX_FADV_SEQUENTIAL")
+            _copyfileobj_readinto(fsrc, fdst)
+            fdst.flush()
+            _fadvise(fsrc.fileno(), "POSIX_FADV_DONTNEED")
+            _fadvise(fdst.fileno(), "POSIX_FADV_DONTNEED")
+
+
+def _resolve(path: Union[str, Path]) -> str:
+    """Return os.path.realpath(path), resolved afresh on every call.
+
+    Deliberately uncached: any component can be swapped for a symlink
+    between two validations, so a memoized resolution would let the
+    security check run on stale data.
+    """
+    return os.path.realpath(path)
+
+
+def _root_prefixes(*roots: str):
+    """Return (prefixes, exact) for matching paths under any of roots.
+
+    Prefixes carry a trailing separator so /media doesn't admit /media2.
+    """
+    return tuple(os.path.join(root, "") for root in roots), frozenset(roots)
+
+
+def _as_path(path: Union[str, Path]) -> Path:
+    """Return path as a Path, reusing it if it already is one."""
+    return path if isinstance(path, Path) else Path(path)
+
+
+def _fast_copy(source: Union[str, Path], destination: Union[str, Path]):
+    """Copy a file using the cheapest mechanism the filesystem supports.
+
+    Tries a reflink clone first, then copy_file_range, then sendfile, and
+    finally falls back to a large-buffer userspace copy. File metadata is
+    preserved in every case.
+
+    Raises:
+        shutil.SameFileError: If destination is the source file (opening it
+            with O_TRUNC would empty the source)
+    """
+    try:
+        src_fd = os.open(source, os.O_RDONLY)
+        try:
+            _check_not_same_file(src_fd, source, destination)
+            dst_fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                if not _reflink(src_fd, dst_fd):
+                    size = os.fstat(src_fd).st_size
+                    try:
+                        _copy_file_range(src_fd, dst_fd, size)
+                    except OSError as e:
+                        if e.errno not in _FAST_COPY_FALLBACK_ERRNOS:
+                            raise
+                        # Both calls advance the shared file offsets, so this
+                        # resumes wherever copy_file_range stopped
+                        copied = os.lseek(src_fd, 0, os.SEEK_CUR)
+                        _sendfile(src_fd, dst_fd, size - copied)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    except OSError as e:
+        if e.errno not in _FAST_COPY_FALLBACK_ERRNOS:
+            raise
+        _buffered_copy(source, destination)
+
+    shutil.copystat(source, destination)
+
+
+def _move(source: str, destination: str):
+    """Rename in place, or copy + unlink across filesystems.
+
+    rename(2) is a single directory-entry update; only EXDEV falls back to
+    copying the data. A failed fallback copy removes its partial output so
+    the source remains the only copy.
+    """
+    try:
+        os.rename(source, destination)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    try:
+        _fast_copy(source, destination)
+    except BaseException:
+        try:
+            os.unlink(destination)
+        except OSError:
+            pass
+        raise
+    os.unlink(source)
 
 
 class FileOperationError(Exception):
@@ -32,10 +282,10 @@ class FileManager:
     Attributes:
         media_root: Root directory for Plex media library
         ingest_dir: Directory for incoming files to be ingested
-        allowed_extensions: Set of allowed video file extensions
+        allowed_extensions: Frozen set of allowed video file extensions
     """
 
-    DEFAULT_EXTENSIONS = {".mkv", ".mp4", ".avi", ".m4v", ".ts", ".wmv", ".mov"}
+    DEFAULT_EXTENSIONS = frozenset({".mkv", ".mp4", ".avi", ".m4v", ".ts", ".wmv", ".mov"})
 
     def __init__(
         self,
@@ -52,13 +302,34 @@ class FileManager:
         """
         self.media_root = Path(media_root).resolve()
         self.ingest_dir = Path(ingest_dir).resolve()
-        self.allowed_extensions = allowed_extensions or self.DEFAULT_EXTENSIONS.copy()
 
+        # Cache root strings for validate_path's prefix compare, keyed by
+        # require_ingest. The resolved roots are checked after
+        # canonicalization; the lexical set also admits the roots as
+        # configured (e.g. a symlinked mount point) for the syscall-free
+        # first pass.
+        media_str, ingest_str = str(self.media_root), str(self.ingest_dir)
+        media_abs, ingest_abs = os.path.abspath(media_root), os.path.abspath(ingest_dir)
+        self._roots = {
+            False: _root_prefixes(media_str, ingest_str),
+            True: _root_prefixes(ingest_str),
+        }
+        self._lexical_roots = {
+            False: _root_prefixes(media_str, ingest_str, media_abs, ingest_abs),
+            True: _root_prefixes(ingest_str, ingest_abs),
+        }
         # Ensure extensions are lowercase with leading dot
-        self.allowed_extensions = {
+        self.allowed_extensions = frozenset(
             ext.lower() if ext.startswith('.') else f'.{ext.lower()}'
-            for ext in self.allowed_extensions
-        }
+            for ext in (allowed_extensions or self.DEFAULT_EXTENSIONS)
+        )
+        # Bare suffixes (no dot) for matching DirEntry names in list_files
+        self._ext_suffixes = frozenset(ext[1:] for ext in self.allowed_extensions)
+
+        # Destination directories already created (or found) by this manager
+        self._made_dirs: Set[str] = set()
+        # Worker threads for the batch operations, created on first use
+        self._io_pool: Optional[ThreadPoolExecutor] = None
 
     def is_valid_extension(self, file_path: Union[str, Path]) -> bool:
         """Check if file has a valid extension.
@@ -69,8 +340,17 @@ class FileManager:
         Returns:
             True if extension is valid, False otherwise
         """
-        path = Path(file_path)
-        return path.suffix.lower() in self.allowed_extensions
+        if isinstance(file_path, Path):
+            name = file_path.name
+        else:
+            name = os.path.basename(file_path)
+        dot = name.rfind('.')
+        if dot <= 0:
+            return False
+        # Most names already use a lowercase suffix; only fold when needed
+        ext = name[dot:]
+        exts = self.allowed_extensions
+        return ext in exts or ext.lower() in exts
 
     def validate_path(
         self,
@@ -79,6 +359,12 @@ class FileManager:
     ) -> bool:
         """Validate that path is within allowed boundaries.
 
+        A path whose normalized form (".." collapsed lexically, no
+        filesystem access) is outside the roots is rejected immediately.
+        Otherwise it is canonicalized with os.path.realpath (so symlinks
+        pointing outside the roots are caught) and compared as a string
+        against the cached, already-resolved root prefixes.
+
         Args:
             path: Path to validate
             require_ingest: If True, path must be within ingest_dir
@@ -89,39 +375,47 @@ class FileManager:
         Raises:
             PathRestrictionError: If path is outside allowed boundaries
         """
-        resolved_path = Path(path).resolve()
-
-        if require_ingest:
-            # Path must be within ingest_dir
-            try:
-                resolved_path.relative_to(self.ingest_dir)
-            except ValueError:
+        if not (
+            self._is_allowed(os.path.abspath(path), require_ingest, lexical=True)
+            and self._is_allowed(_resolve(path), require_ingest)
+        ):
+            if require_ingest:
                 raise PathRestrictionError(
                     f"Path {path} is outside ingest directory {self.ingest_dir}"
                 )
-        else:
-            # Path must be within media_root or ingest_dir
-            in_media = False
-            in_ingest = False
-
-            try:
-                resolved_path.relative_to(self.media_root)
-                in_media = True
-            except ValueError:
-                pass
+            raise PathRestrictionError(
+                f"Path {path} is outside allowed directories"
+            )
 
-            try:
-                resolved_path.relative_to(self.ingest_dir)
-                in_ingest = True
-            except ValueError:
-                pass
+        return True
 
-            if not (in_media or in_ingest):
-                raise PathRestrictionError(
-                    f"Path {path} is outside allowed directories"
-                )
+    def _into_dir(self, dest_str: str, operation, *args):
+        """Run operation after making sure dest_str's parent directory exists.
 
-        return True
+        Parents are remembered so bulk ingests into the same directory skip
+        makedirs. If a remembered directory has since been removed, the
+        operation fails with FileNotFoundError; the directory is then
+        recreated and the operation retried once.
+        """
+        parent = os.path.dirname(dest_str)
+        if not parent:
+            return operation(*args)
+        if parent not in self._made_dirs:
+            os.makedirs(parent, exist_ok=True)
+            self._made_dirs.add(parent)
+            return operation(*args)
+        try:
+            return operation(*args)
+        except FileNotFoundError:
+            if os.path.isdir(parent):
+                raise
+            os.makedirs(parent, exist_ok=True)
+            return operation(*args)
+
+    def _is_allowed(self, path_str: str, require_ingest: bool, lexical: bool = False) -> bool:
+        """Check an absolute path string against the cached root prefixes."""
+        prefixes, exact = (self._lexical_roots if lexical else self._roots)[require_ingest]
+        return path_str.startswith(prefixes) or path_str in exact
 
     def copy_file(
         self,
@@ -142,31 +436,30 @@ class FileManager:
             PathRestrictionError: If paths are outside allowed boundaries
             FileOperationError: If copy operation fails
         """
-        source_path = Path(source)
-        dest_path = Path(destination)
+        source_str = os.fspath(source)
+        dest_str = os.fspath(destination)
 
         # Validate extension
-        if not self.is_valid_extension(source_path):
+        if not self.is_valid_extension(source_str):
             raise InvalidExtensionError(
-                f"File extension {source_path.suffix} is not allowed"
+                f"File extension {os.path.splitext(source_str)[1]} is not allowed"
             )
 
         # Validate paths
-        self.validate_path(source_path, require_ingest=False)
-        self.validate_path(dest_path, require_ingest=False)
-
-        # Check source exists
-        if not source_path.exists():
-            raise FileOperationError(f"Source file {source_path} does not exist")
+        self.validate_path(source_str, require_ingest=False)
+        self.validate_path(dest_str, require_ingest=False)
 
         try:
-            # Create parent directories if needed
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy file
-            shutil.copy2(source_path, dest_path)
-
-            return dest_path
+            # Copy file (reflink / copy_file_range when available), creating
+            # parent directories if needed. The source is opened first, so a
+            # missing source fails there without an upfront exists() check.
+            self._into_dir(dest_str, _fast_copy, source_str, dest_str)
+
+            return _as_path(destination)
+        except FileNotFoundError as e:
+            if e.filename == source_str:
+                raise FileOperationError(f"Source file {source_str} does not exist")
+            raise FileOperationError(f"Failed to copy file: {e}")
         except Exception as e:
             raise FileOperationError(f"Failed to copy file: {e}")
 
@@ -189,27 +482,24 @@ class FileManager:
             PathRestrictionError: If paths are outside allowed boundaries
             FileOperationError: If move operation fails
         """
-        source_path = Path(source)
-        dest_path = Path(destination)
+        source_str = os.fspath(source)
+        dest_str = os.fspath(destination)
 
         # Validate extension
-        if not self.is_valid_extension(source_path):
+        if not self.is_valid_extension(source_str):
             raise InvalidExtensionError(
-                f"File extension {source_path.suffix} is not allowed"
+                f"File extension {os.path.splitext(source_str)[1]} is not allowed"
             )
 
         # Validate paths
-        self.validate_path(source_path, require_ingest=False)
-        self.validate_path(dest_path, require_ingest=False)
+        self.validate_path(source_str, require_ingest=False)
+        self.validate_path(dest_str, require_ingest=False)
 
         try:
-            # Create parent directories if needed
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            # Move file, creating parent directories if needed
+            self._into_dir(dest_str, _move, source_str, dest_str)
 
-            # Move file
-            shutil.move(str(source_path), str(dest_path))
-
-            return dest_path
+            return _as_path(destination)
         except Exception as e:
             raise FileOperationError(f"Failed to move file: {e}")
 
@@ -231,21 +521,20 @@ class FileManager:
             InvalidExtensionError: If new extension is not allowed
             FileOperationError: If rename contains path traversal
         """
-        source_path = Path(source)
+        source_str = os.fspath(source)
 
         # Prevent path traversal
         if '/' in new_name or '\\' in new_name or '..' in new_name:
             raise FileOperationError("New name cannot contain path separators")
 
-        dest_path = source_path.parent / new_name
-
         # Validate extension of new name
-        if not self.is_valid_extension(dest_path):
+        if not self.is_valid_extension(new_name):
             raise InvalidExtensionError(
-                f"File extension {dest_path.suffix} is not allowed"
+                f"File extension {os.path.splitext(new_name)[1]} is not allowed"
             )
 
-        return self.move_file(source_path, dest_path)
+        dest_str = os.path.join(os.path.dirname(source_str), new_name)
+        return self.move_file(source_str, dest_str)
 
     def delete_file(self, file_path: Union[str, Path]) -> bool:
         """Delete file with validation.
@@ -260,20 +549,141 @@ class FileManager:
             PathRestrictionError: If path is outside allowed boundaries
             FileOperationError: If file doesn't exist or delete fails
         """
-        path = Path(file_path)
+        path_str = os.fspath(file_path)
 
         # Validate path
-        self.validate_path(path, require_ingest=False)
-
-        if not path.exists():
-            raise FileOperationError(f"File {path} does not exist")
+        self.validate_path(path_str, require_ingest=False)
 
         try:
-            path.unlink()
+            os.unlink(path_str)
             return True
+        except FileNotFoundError:
+            raise FileOperationError(f"File {path_str} does not exist")
         except Exception as e:
             raise FileOperationError(f"Failed to delete file: {e}")
 
+    def copy_files(
+        self,
+        pairs: Iterable[Tuple[Union[str, Path], Union[str, Path]]]
+    ) -> List[Path]:
+        """Copy several files concurrently.
+
+        Every pair is validated before any data is copied, so a bad path
+        aborts the whole batch up front.
+
+        Args:
+            pairs: (source, destination) tuples
+
+        Returns:
+            Destination paths, in input order
+
+        Raises:
+            InvalidExtensionError: If a file extension is not allowed
+            PathRestrictionError: If a path is outside allowed boundaries
+            FileOperationError: If a source is missing or any copy fails
+        """
+        pairs = self._validate_pairs(pairs)
+        for source_str, _ in pairs:
+            if not os.path.exists(source_str):
+                raise FileOperationError(f"Source file {source_str} does not exist")
+        return self._run_batch("copy", _fast_copy, pairs)
+
+    def move_files(
+        self,
+        pairs: Iterable[Tuple[Union[str, Path], Union[str, Path]]]
+    ) -> List[Path]:
+        """Move several files concurrently.
+
+        Every pair is validated before anything is moved. Same-filesystem
+        moves are cheap renames; the concurrency pays off for cross-device
+        moves, which copy data.
+
+        Args:
+            pairs: (source, destination) tuples
+
+        Returns:
+            Destination paths, in input order
+
+        Raises:
+            InvalidExtensionError: If a file extension is not allowed
+            PathRestrictionError: If a path is outside allowed boundaries
+            FileOperationError: If any move fails
+        """
+        return self._run_batch("move", _move, self._validate_pairs(pairs))
+
+    def delete_files(self, file_paths: Iterable[Union[str, Path]]) -> int:
+        """Delete several files after validating all of them.
+
+        Args:
+            file_paths: Paths to delete
+
+        Returns:
+            Number of files deleted
+
+        Raises:
+            PathRestrictionError: If a path is outside allowed boundaries
+            FileOperationError: If a file doesn't exist or a delete fails
+        """
+        path_strs = [os.fspath(p) for p in file_paths]
+        for path_str in path_strs:
+            self.validate_path(path_str, require_ingest=False)
+
+        for path_str in path_strs:
+            try:
+                os.unlink(path_str)
+            except FileNotFoundError:
+                raise FileOperationError(f"File {path_str} does not exist")
+            except Exception as e:
+                raise FileOperationError(f"Failed to delete file: {e}")
+        return len(path_strs)
+
+    def _validate_pairs(
+        self,
+        pairs: Iterable[Tuple[Union[str, Path], Union[str, Path]]]
+    ) -> List[Tuple[str, str]]:
+        """Check extensions and paths for a batch, returning string pairs."""
+        validated = []
+        for source, destination in pairs:
+            source_str = os.fspath(source)
+            dest_str = os.fspath(destination)
+            if not self.is_valid_extension(source_str):
+                raise InvalidExtensionError(
+                    f"File extension {os.path.splitext(source_str)[1]} is not allowed"
+                )
+            self.validate_path(source_str, require_ingest=False)
+            self.validate_path(dest_str, require_ingest=False)
+            validated.append((source_str, dest_str))
+        return validated
+
+    def _run_batch(
+        self,
+        verb: str,
+        operation: Callable[[str, str], None],
+        pairs: List[Tuple[str, str]]
+    ) -> List[Path]:
+        """Run operation over validated pairs on the I/O pool.
+
+        Waits for every job, then raises the first failure (in input
+        order) as a FileOperationError.
+        """
+        if not pairs:
+            return []
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 2),
+                thread_name_prefix="filemanager"
+            )
+
+        futures = [
+            self._io_pool.submit(self._into_dir, dest_str, operation, source_str, dest_str)
+            for source_str, dest_str in pairs
+        ]
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise FileOperationError(f"Failed to {verb} file: {error}")
+        return [Path(dest_str) for _, dest_str in pairs]
+
     def list_files(
         self,
         directory: Union[str, Path],
@@ -288,16 +698,31 @@ class FileManager:
         Returns:
             List of paths to valid video files
         """
-        dir_path = Path(directory)
-
-        if recursive:
-            pattern = "**/*"
-        else:
-            pattern = "*"
-
+        ext_suffixes = self._ext_suffixes
         files = []
-        for path in dir_path.glob(pattern):
-            if path.is_file() and self.is_valid_extension(path):
-                files.append(path)
+        stack = [os.fspath(directory)]
 
-        return sorted(files)
+        while stack:
+            current = stack.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                        continue
+                    stem, _, ext = entry.name.rpartition('.')
+                    if (
+                        stem
+                        and (ext in ext_suffixes or ext.lower() in ext_suffixes)
+                        and entry.is_file()
+                    ):
+                        files.append(entry.path)
+
+        # Sort the plain strings by component (the order Path comparison
+        # gives) and only then build Path objects for the results
+        files.sort(key=lambda p: p.split(os.sep))
+        return [Path(p) for p in files]
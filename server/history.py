@@ -9,13 +9,128 @@ This module provides an audit log for tracking file ingest operations with:
 """
 
 import json
+import os
 import aiosqlite
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
 from enum import Enum
 from dataclasses import dataclass, asdict
 
+from server.sqlite_pool import SQLiteReaderPool
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+# Metadata is stored as UTF-8 JSON bytes (a BLOB); loading also accepts the
+# TEXT values written by older versions.
+if orjson is not None:
+    def _dumps_metadata(metadata: Dict[str, Any]) -> bytes:
+        """Serialize metadata to JSON bytes, accepting non-string keys like json."""
+        return orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads_metadata = orjson.loads
+else:
+    def _dumps_metadata(metadata: Dict[str, Any]) -> bytes:
+        """Serialize metadata to JSON bytes."""
+        return json.dumps(metadata).encode()
+
+    _loads_metadata = json.loads
+
+
+_INSERT_RECORD_SQL = """
+    INSERT INTO ingest_records
+    (timestamp, source_path, destination_path, status, tmdb_id,
+     media_type, confidence, metadata, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Requires SQLite 3.35+ for RETURNING
+_INSERT_RECORD_RETURNING_SQL = _INSERT_RECORD_SQL + "    RETURNING *\n"
+
+_UPDATE_STATUS_SQL = "UPDATE ingest_records SET status = ? WHERE id = ?"
+
+_GET_RECORD_SQL = "SELECT * FROM ingest_records WHERE id = ?"
+
+_DUPLICATE_KEYS_SQL = "SELECT tmdb_id, source_path FROM ingest_records WHERE id = ?"
+
+_ALL_RECORDS_SQL = "SELECT * FROM ingest_records ORDER BY timestamp DESC, id DESC"
+
+_RECENT_RECORDS_SQL = (
+    "SELECT * FROM ingest_records ORDER BY timestamp DESC, id DESC LIMIT ?"
+)
+
+_STATISTICS_SQL = "SELECT status, count FROM ingest_stats"
+
+# Schema objects that keep ingest_stats in step with ingest_records
+_STATS_OBJECTS = ("ingest_stats", "trg_stats_insert", "trg_stats_update", "trg_stats_delete")
+
+_STATS_OBJECTS_SQL = "SELECT COUNT(*) FROM sqlite_master WHERE name IN ({})".format(
+    ", ".join("?" * len(_STATS_OBJECTS))
+)
+
+# UPDATE statements keyed by the tuple of columns being set
+_UPDATE_SQL_CACHE: Dict[tuple, str] = {}
+
+
+def _update_sql(fields: tuple) -> str:
+    """Return the UPDATE statement for a set of columns, building it once."""
+    query = _UPDATE_SQL_CACHE.get(fields)
+    if query is None:
+        assignments = ", ".join(f"{field} = ?" for field in fields)
+        query = f"UPDATE ingest_records SET {assignments} WHERE id = ?"
+        _UPDATE_SQL_CACHE[fields] = query
+    return query
+
+
+# query_records statements keyed by the tuple of filter conditions used
+_QUERY_SQL_CACHE: Dict[tuple, str] = {}
+
+
+def _query_sql(conditions: tuple) -> str:
+    """Return the query_records statement for a set of filters, building it once."""
+    query = _QUERY_SQL_CACHE.get(conditions)
+    if query is None:
+        query = "SELECT * FROM ingest_records"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY timestamp DESC, id DESC"
+        _QUERY_SQL_CACHE[conditions] = query
+    return query
+
+
+def _build_duplicate_sql() -> Dict[tuple, str]:
+    """Build every is_duplicate query up front.
+
+    Keyed by (has tmdb_id, has source_path, exclude_failed); each query
+    stops at the first matching index entry.
+    """
+    queries = {}
+    for has_tmdb in (False, True):
+        for has_source in (False, True):
+            for exclude_failed in (False, True):
+                conditions = []
+                if has_tmdb:
+                    conditions.append("tmdb_id = ?")
+                if has_source:
+                    conditions.append("source_path = ?")
+                if exclude_failed:
+                    conditions.append("status != ?")
+                if conditions:
+                    queries[has_tmdb, has_source, exclude_failed] = (
+                        "SELECT 1 FROM ingest_records WHERE "
+                        + " AND ".join(conditions) + " LIMIT 1"
+                    )
+    return queries
+
+
+_DUPLICATE_SQL = _build_duplicate_sql()
+
 
 class IngestStatus(str, Enum):
     """Ingest operation status."""
@@ -24,9 +139,22 @@ class IngestStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Interned status string used directly in SQL parameters and comparisons
+_STATUS_FAILED = IngestStatus.FAILED.value
+
+# Enum members by stored value; a dict lookup is cheaper than IngestStatus(value)
+_STATUS_BY_VALUE = {status.value: status for status in IngestStatus}
+# Stored value by status (members hash like their values, so raw strings work too)
+_VALUE_BY_STATUS = {status: status.value for status in IngestStatus}
+
+
+@dataclass(slots=True)
 class IngestRecord:
-    """Represents a single ingest operation record."""
+    """Represents a single ingest operation record.
+
+    Fields are declared in ingest_records column order, so from_row can
+    build a record positionally from a SELECT * row.
+    """
     id: int
     timestamp: datetime
     source_path: str
@@ -38,26 +166,105 @@ class IngestRecord:
     metadata: Optional[Dict[str, Any]] = None
     error_message: Optional[str] = None
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "IngestRecord":
+        """Build a record from an ingest_records row (SELECT * order).
+
+        Args:
+            row: Database row tuple
+
+        Returns:
+            IngestRecord instance
+        """
+        (record_id, timestamp, source_path, destination_path, status,
+         tmdb_id, media_type, confidence, metadata, error_message) = row
+
+        return cls(
+            record_id,
+            datetime.fromisoformat(timestamp),
+            source_path,
+            destination_path,
+            _STATUS_BY_VALUE[status],
+            tmdb_id,
+            media_type,
+            confidence,
+            _loads_metadata(metadata) if metadata else None,
+            error_message
+        )
+
 
 class IngestHistory:
     """Manages SQLite database for ingest operation history.
 
+    Writes go through a single writer connection; reads are served from a
+    small pool of read-only connections so MCP queries don't queue behind
+    watcher writes.
+
     Attributes:
         db_path: Path to SQLite database file
+        reader_count: Number of read-only connections in the pool
     """
 
-    def __init__(self, db_path: Union[str, Path]):
+    # Maximum number of positive is_duplicate results kept in memory
+    DUP_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        reader_count: int = 2,
+        *,
+        connection: Optional[aiosqlite.Connection] = None
+    ):
         """Initialize IngestHistory with database path.
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, ":memory:", or a "file:"
+                URI such as "file:name?mode=memory&cache=shared"
+            reader_count: Number of read-only connections (0 to read via the writer)
+            connection: Already-open connection to use instead of opening one.
+                The caller owns it: close() leaves it open, and all reads go
+                through it.
         """
         self.db_path = Path(db_path)
-        self._db: Optional[aiosqlite.Connection] = None
+        self._database = os.fspath(db_path)
+        self._is_uri = self._database.startswith("file:")
+        self._in_memory = self._database == ":memory:" or (
+            self._is_uri and "mode=memory" in self._database
+        )
+        # The reader pool opens file paths read-only; URIs and injected
+        # connections are read through the writer
+        if connection is not None or self._is_uri:
+            reader_count = 0
+        self.reader_count = reader_count
+        self._db: Optional[aiosqlite.Connection] = connection
+        self._owns_db = connection is None
+        self._readers = SQLiteReaderPool(self.db_path, size=reader_count)
+        # LRU of (tmdb_id, source_path) keys known to have a non-failed record
+        self._dup_cache: "OrderedDict[tuple, None]" = OrderedDict()
+        # Bumped whenever keys are forgotten, so a lookup whose read started
+        # before the change doesn't re-cache a stale positive
+        self._dup_generation = 0
 
     async def initialize(self):
-        """Initialize database and create schema if needed."""
-        self._db = await aiosqlite.connect(str(self.db_path))
+        """Initialize database and create schema if needed.
+
+        Opens the writer connection on the first call; an injected
+        connection is used as-is, with its PRAGMAs left to the caller.
+        """
+        if self._db is None:
+            self._db = await aiosqlite.connect(self._database, uri=self._is_uri)
+
+            # WAL + relaxed sync: commits no longer fsync the main database
+            # file (in-memory databases have no journal file to switch)
+            if not self._in_memory:
+                await self._db.execute("PRAGMA journal_mode=WAL")
+            await self._db.execute("PRAGMA synchronous=NORMAL")
+            await self._db.execute("PRAGMA temp_store=MEMORY")
+            await self._db.execute("PRAGMA cache_size=-65536")
+            await self._db.execute("PRAGMA mmap_size=268435456")
+            # Wait for a competing writer (e.g. another process) instead of
+            # failing immediately with "database is locked"
+            await self._db.execute("PRAGMA busy_timeout=5000")
 
         # Create table if it doesn't exist
         await self._db.execute("""
@@ -70,7 +277,7 @@ class IngestHistory:
                 tmdb_id INTEGER,
                 media_type TEXT,
                 confidence REAL,
-                metadata TEXT,
+                metadata BLOB,
                 error_message TEXT
             )
         """)
@@ -89,12 +296,101 @@ class IngestHistory:
             ON ingest_records(timestamp)
         """)
 
+        # Indexes for is_duplicate lookups
+        await self._db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_dup
+            ON ingest_records(tmdb_id, status)
+        """)
+        await self._db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_source_status
+            ON ingest_records(source_path, status)
+        """)
+        # Superseded by idx_source_status, which has source_path as its prefix
+        await self._db.execute("DROP INDEX IF EXISTS idx_source_path")
+
+        # Per-status counters maintained by triggers so get_statistics
+        # reads a handful of rows instead of grouping the whole table
+        async with self._db.execute(_STATS_OBJECTS_SQL, _STATS_OBJECTS) as cursor:
+            (existing,) = await cursor.fetchone()
+        await self._db.execute("""
+            CREATE TABLE IF NOT EXISTS ingest_stats (
+                status TEXT PRIMARY KEY,
+                count INTEGER NOT NULL
+            )
+        """)
+        await self._db.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_stats_insert
+            AFTER INSERT ON ingest_records
+            BEGIN
+                INSERT INTO ingest_stats (status, count) VALUES (NEW.status, 1)
+                ON CONFLICT(status) DO UPDATE SET count = count + 1;
+            END
+        """)
+        await self._db.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_stats_update
+            AFTER UPDATE OF status ON ingest_records
+            WHEN OLD.status != NEW.status
+            BEGIN
+                UPDATE ingest_stats SET count = count - 1 WHERE status = OLD.status;
+                INSERT INTO ingest_stats (status, count) VALUES (NEW.status, 1)
+                ON CONFLICT(status) DO UPDATE SET count = count + 1;
+            END
+        """)
+        await self._db.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_stats_delete
+            AFTER DELETE ON ingest_records
+            BEGIN
+                UPDATE ingest_stats SET count = count - 1 WHERE status = OLD.status;
+            END
+        """)
+
+        # Rebuild counters from the (index-only) grouped scan only when the
+        # table or a trigger was just created; otherwise they are current
+        if existing < len(_STATS_OBJECTS):
+            await self._db.execute("DELETE FROM ingest_stats")
+            await self._db.execute("""
+                INSERT INTO ingest_stats (status, count)
+                SELECT status, COUNT(*) FROM ingest_records GROUP BY status
+            """)
+
         await self._db.commit()
 
+        # Let the planner gather statistics for the indexes above
+        await self._db.execute("PRAGMA optimize")
+
+        await self._readers.open()
+
+    @asynccontextmanager
+    async def _reader(self):
+        """Borrow a read-only connection, or the writer if there is no pool."""
+        async with self._readers.acquire(fallback=self._db) as db:
+            yield db
+
+    async def _fetchall(self, query: str, params=()) -> list:
+        """Run a read query on a pooled connection and fetch all rows."""
+        async with self._reader() as db:
+            cursor = await db.execute(query, params)
+            return await cursor.fetchall()
+
+    async def _fetchone(self, query: str, params=()):
+        """Run a read query on a pooled connection and fetch one row."""
+        async with self._reader() as db:
+            cursor = await db.execute(query, params)
+            return await cursor.fetchone()
+
     async def close(self):
-        """Close database connection."""
-        if self._db:
-            await self._db.close()
+        """Close database connections (an injected connection stays open)."""
+        await self._readers.close()
+        db, self._db = self._db, None
+        if db is not None and self._owns_db:
+            await db.close()
+
+    async def __aenter__(self) -> "IngestHistory":
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
 
     async def add_record(
         self,
@@ -122,29 +418,107 @@ class IngestHistory:
         Returns:
             ID of inserted record
         """
-        timestamp = datetime.now().isoformat()
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        cursor = await self._db.execute("""
-            INSERT INTO ingest_records
-            (timestamp, source_path, destination_path, status, tmdb_id,
-             media_type, confidence, metadata, error_message)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            timestamp,
-            str(source_path),
-            str(destination_path),
-            status.value,
-            tmdb_id,
-            media_type,
-            confidence,
-            metadata_json,
-            error_message
+        source_path = os.fspath(source_path)
+        cursor = await self._db.execute(_INSERT_RECORD_SQL, self._record_params(
+            source_path, destination_path, status, tmdb_id,
+            media_type, confidence, metadata, error_message
         ))
 
         await self._db.commit()
+        if status != _STATUS_FAILED:
+            self._remember_duplicate(tmdb_id, source_path)
         return cursor.lastrowid
 
+    async def add_record_returning(
+        self,
+        source_path: Union[str, Path],
+        destination_path: Union[str, Path],
+        status: IngestStatus,
+        tmdb_id: Optional[int] = None,
+        media_type: Optional[str] = None,
+        confidence: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None
+    ) -> IngestRecord:
+        """Add a new ingest record and return it as stored.
+
+        Same arguments as add_record; saves the follow-up get_record
+        round-trip by reading the row back with INSERT ... RETURNING.
+
+        Returns:
+            The inserted IngestRecord
+        """
+        source_path = os.fspath(source_path)
+        cursor = await self._db.execute(_INSERT_RECORD_RETURNING_SQL, self._record_params(
+            source_path, destination_path, status, tmdb_id,
+            media_type, confidence, metadata, error_message
+        ))
+        row = await cursor.fetchone()
+        await cursor.close()
+
+        await self._db.commit()
+        if status != _STATUS_FAILED:
+            self._remember_duplicate(tmdb_id, source_path)
+        return IngestRecord.from_row(row)
+
+    async def add_records_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """Add many ingest records in a single transaction.
+
+        Args:
+            records: List of dicts with the same keys as add_record's arguments
+
+        Returns:
+            Number of records inserted
+        """
+        if not records:
+            return 0
+
+        params = [
+            self._record_params(
+                record["source_path"],
+                record["destination_path"],
+                record["status"],
+                record.get("tmdb_id"),
+                record.get("media_type"),
+                record.get("confidence"),
+                record.get("metadata"),
+                record.get("error_message"),
+            )
+            for record in records
+        ]
+
+        await self._db.executemany(_INSERT_RECORD_SQL, params)
+        await self._db.commit()
+        # params[1] is the source path, already converted to a string
+        for record, row in zip(records, params):
+            if record["status"] != _STATUS_FAILED:
+                self._remember_duplicate(record.get("tmdb_id"), row[1])
+        return len(params)
+
+    @staticmethod
+    def _record_params(
+        source_path: Union[str, Path],
+        destination_path: Union[str, Path],
+        status: IngestStatus,
+        tmdb_id: Optional[int],
+        media_type: Optional[str],
+        confidence: Optional[float],
+        metadata: Optional[Dict[str, Any]],
+        error_message: Optional[str]
+    ) -> tuple:
+        """Build the INSERT parameter tuple for one record."""
+        return (
+            datetime.now().isoformat(),
+            os.fspath(source_path),
+            os.fspath(destination_path),
+            _VALUE_BY_STATUS[status],
+            tmdb_id,
+            media_type,
+            confidence,
+            _dumps_metadata(metadata) if metadata else None,
+            error_message
+        )
+
     async def get_record(self, record_id: int) -> Optional[IngestRecord]:
         """Get a record by ID.
 
@@ -154,15 +528,12 @@ class IngestHistory:
         Returns:
             IngestRecord if found, None otherwise
         """
-        cursor = await self._db.execute("""
-            SELECT * FROM ingest_records WHERE id = ?
-        """, (record_id,))
+        row = await self._fetchone(_GET_RECORD_SQL, (record_id,))
 
-        row = await cursor.fetchone()
         if not row:
             return None
 
-        return self._row_to_record(row)
+        return IngestRecord.from_row(row)
 
     async def update_record(
         self,
@@ -181,46 +552,57 @@ class IngestHistory:
             confidence: New confidence (optional)
             error_message: New error message (optional)
         """
-        updates = []
-        values = []
-
-        if status is not None:
-            updates.append("status = ?")
-            values.append(status.value)
-
-        if tmdb_id is not None:
-            updates.append("tmdb_id = ?")
-            values.append(tmdb_id)
-
-        if confidence is not None:
-            updates.append("confidence = ?")
-            values.append(confidence)
-
-        if error_message is not None:
-            updates.append("error_message = ?")
-            values.append(error_message)
-
-        if not updates:
-            return
+        if tmdb_id is None and confidence is None and error_message is None:
+            # Fast path: status-only update (PENDING -> SUCCESS)
+            if status is None:
+                return
+            query = _UPDATE_STATUS_SQL
+            values = [_VALUE_BY_STATUS[status]]
+        else:
+            fields = []
+            values = []
+
+            if status is not None:
+                fields.append("status")
+                values.append(_VALUE_BY_STATUS[status])
+
+            if tmdb_id is not None:
+                fields.append("tmdb_id")
+                values.append(tmdb_id)
+
+            if confidence is not None:
+                fields.append("confidence")
+                values.append(confidence)
+
+            if error_message is not None:
+                fields.append("error_message")
+                values.append(error_message)
+
+            query = _update_sql(tuple(fields))
+
+        # A record turning FAILED or changing TMDb ID may no longer make its
+        # old keys duplicates. They are dropped once the change is committed:
+        # until then readers still see the old row and could re-cache them.
+        old_keys = None
+        if status == _STATUS_FAILED or tmdb_id is not None:
+            cursor = await self._db.execute(_DUPLICATE_KEYS_SQL, (record_id,))
+            old_keys = await cursor.fetchone()
 
         values.append(record_id)
-        query = f"UPDATE ingest_records SET {', '.join(updates)} WHERE id = ?"
-
         await self._db.execute(query, values)
         await self._db.commit()
 
+        if old_keys:
+            self._forget_duplicate(old_keys[0], old_keys[1])
+
     async def get_all_records(self) -> List[IngestRecord]:
         """Get all records.
 
         Returns:
             List of all IngestRecords
         """
-        cursor = await self._db.execute("""
-            SELECT * FROM ingest_records ORDER BY timestamp DESC
-        """)
-
-        rows = await cursor.fetchall()
-        return [self._row_to_record(row) for row in rows]
+        rows = await self._fetchall(_ALL_RECORDS_SQL)
+        return [IngestRecord.from_row(row) for row in rows]
 
     async def query_records(
         self,
@@ -247,7 +629,7 @@ class IngestHistory:
 
         if status is not None:
             conditions.append("status = ?")
-            values.append(status.value)
+            values.append(_VALUE_BY_STATUS[status])
 
         if tmdb_id is not None:
             conditions.append("tmdb_id = ?")
@@ -265,14 +647,8 @@ class IngestHistory:
             conditions.append("timestamp <= ?")
             values.append(end_date.isoformat())
 
-        query = "SELECT * FROM ingest_records"
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-        query += " ORDER BY timestamp DESC"
-
-        cursor = await self._db.execute(query, values)
-        rows = await cursor.fetchall()
-        return [self._row_to_record(row) for row in rows]
+        rows = await self._fetchall(_query_sql(tuple(conditions)), values)
+        return [IngestRecord.from_row(row) for row in rows]
 
     async def is_duplicate(
         self,
@@ -290,29 +666,73 @@ class IngestHistory:
         Returns:
             True if duplicate exists
         """
-        conditions = []
-        values = []
-
-        if tmdb_id is not None:
-            conditions.append("tmdb_id = ?")
-            values.append(tmdb_id)
+        source = os.fspath(source_path) if source_path is not None else None
+        query = _DUPLICATE_SQL.get(
+            (tmdb_id is not None, source is not None, bool(exclude_failed))
+        )
+        if query is None:
+            return False
 
-        if source_path is not None:
-            conditions.append("source_path = ?")
-            values.append(str(source_path))
+        key = (tmdb_id, source)
+        if key in self._dup_cache:
+            self._dup_cache.move_to_end(key)
+            return True
 
+        values = [v for v in key if v is not None]
         if exclude_failed:
-            conditions.append("status != ?")
-            values.append(IngestStatus.FAILED.value)
+            values.append(_STATUS_FAILED)
 
-        if not conditions:
+        generation = self._dup_generation
+        row = await self._fetchone(query, values)
+        if row is None:
             return False
 
-        query = f"SELECT COUNT(*) FROM ingest_records WHERE {' AND '.join(conditions)}"
+        # Only non-failed matches are valid for both exclude_failed modes
+        if exclude_failed and generation == self._dup_generation:
+            self._cache_duplicate_key(key)
+        return True
+
+    def _cache_duplicate_key(self, key: tuple):
+        """Insert a key into the duplicate LRU, evicting the oldest if full."""
+        self._dup_cache[key] = None
+        self._dup_cache.move_to_end(key)
+        if len(self._dup_cache) > self.DUP_CACHE_SIZE:
+            self._dup_cache.popitem(last=False)
+
+    @staticmethod
+    def _duplicate_keys(
+        tmdb_id: Optional[int],
+        source_path: Optional[Union[str, Path]]
+    ) -> List[tuple]:
+        """All is_duplicate lookup keys a record with these fields satisfies."""
+        source = os.fspath(source_path) if source_path is not None else None
+        keys = []
+        if tmdb_id is not None:
+            keys.append((tmdb_id, None))
+        if source is not None:
+            keys.append((None, source))
+        if tmdb_id is not None and source is not None:
+            keys.append((tmdb_id, source))
+        return keys
+
+    def _remember_duplicate(
+        self,
+        tmdb_id: Optional[int],
+        source_path: Optional[Union[str, Path]]
+    ):
+        """Record that a non-failed record exists for these fields."""
+        for key in self._duplicate_keys(tmdb_id, source_path):
+            self._cache_duplicate_key(key)
 
-        cursor = await self._db.execute(query, values)
-        row = await cursor.fetchone()
-        return row[0] > 0
+    def _forget_duplicate(
+        self,
+        tmdb_id: Optional[int],
+        source_path: Optional[Union[str, Path]]
+    ):
+        """Drop cached duplicate keys for a record whose status changed."""
+        self._dup_generation += 1
+        for key in self._duplicate_keys(tmdb_id, source_path):
+            self._dup_cache.pop(key, None)
 
     async def get_recent_records(self, limit: int = 10) -> List[IngestRecord]:
         """Get most recent records.
@@ -323,14 +743,9 @@ class IngestHistory:
         Returns:
             List of recent IngestRecords
         """
-        cursor = await self._db.execute("""
-            SELECT * FROM ingest_records
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,))
+        rows = await self._fetchall(_RECENT_RECORDS_SQL, (limit,))
 
-        rows = await cursor.fetchall()
-        return [self._row_to_record(row) for row in rows]
+        return [IngestRecord.from_row(row) for row in rows]
 
     async def get_statistics(self) -> Dict[str, int]:
         """Get ingest statistics.
@@ -338,13 +753,7 @@ class IngestHistory:
         Returns:
             Dictionary with statistics (total, success, failed, pending)
         """
-        cursor = await self._db.execute("""
-            SELECT status, COUNT(*) as count
-            FROM ingest_records
-            GROUP BY status
-        """)
-
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(_STATISTICS_SQL)
 
         stats = {
             "total": 0,
@@ -353,38 +762,9 @@ class IngestHistory:
             "pending": 0
         }
 
-        for row in rows:
-            status, count = row
+        for status, count in rows:
             stats["total"] += count
-            if status == IngestStatus.SUCCESS.value:
-                stats["success"] = count
-            elif status == IngestStatus.FAILED.value:
-                stats["failed"] = count
-            elif status == IngestStatus.PENDING.value:
-                stats["pending"] = count
+            if status in _STATUS_BY_VALUE:
+                stats[status] = count
 
         return stats
-
-    def _row_to_record(self, row) -> IngestRecord:
-        """Convert database row to IngestRecord.
-
-        Args:
-            row: Database row tuple
-
-        Returns:
-            IngestRecord instance
-        """
-        metadata = json.loads(row[8]) if row[8] else None
-
-        return IngestRecord(
-            id=row[0],
-            timestamp=datetime.fromisoformat(row[1]),
-            source_path=row[2],
-            destination_path=row[3],
-            status=IngestStatus(row[4]),
-            tmdb_id=row[5],
-            media_type=row[6],
-            confidence=row[7],
-            metadata=metadata,
-            error_message=row[9]
-        )
@@ -12,7 +12,7 @@ from mcp.server import FastMCP
 from server.client import create_plex_client
 from server.tmdb_cache import TMDbCache
 from server.matcher import MediaMatcher
-from server.files import FileManager
+from server.files import FileManager, PathRestrictionError
 from server.history import IngestHistory
 from server.watcher import IngestWatcher
 from server.transmission import TransmissionClient
@@ -26,25 +26,35 @@ from server.safety import validate_operation, get_safety_metadata, TOOL_SAFETY_M
 
 def load_config():
     """Load configuration from ~/.config/videodrome/.env or current directory."""
-    # Try config directory first
-    config_dir = Path.home() / ".config" / "videodrome"
-    config_file = config_dir / ".env"
+    # Try config directory first, then fall back to current directory
+    candidates = (
+        Path.home() / ".config" / "videodrome" / ".env",
+        Path.cwd() / ".env",
+    )
 
-    if config_file.exists():
-        env_path = config_file
-    else:
-        # Fallback to current directory
-        env_path = Path.cwd() / ".env"
-
-    if env_path.exists():
-        # Load environment variables from file
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    key, _, value = line.partition('=')
-                    if key and value:
-                        os.environ.setdefault(key.strip(), value.strip())
+    for env_path in candidates:
+        try:
+            text = env_path.read_text(encoding="utf-8")
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        # Load environment variables from file without overriding existing ones
+        entries = (
+            line.split("=", 1)
+            for line in text.splitlines()
+            if "=" in line and not line.lstrip().startswith("#")
+        )
+        # The first occurrence of a repeated key wins
+        parsed = {}
+        for key, value in entries:
+            key, value = key.strip(), value.strip()
+            if key and value:
+                parsed.setdefault(key, value)
+        os.environ.update({
+            key: value
+            for key, value in parsed.items()
+            if key not in os.environ
+        })
         return env_path
     return None
 
@@ -139,6 +149,7 @@ async def lifespan(mcp: FastMCP):
         cache=tmdb_cache,
         media_root=media_root
     )
+    media.set_matcher(matcher)
 
     # Initialize FileManager
     if ingest_dir:
@@ -325,13 +336,20 @@ async def preview_rename(filename: str) -> dict:
 
 
 @mcp.tool()
-async def batch_identify(directory: str) -> list[dict]:
+async def batch_identify(directory: str) -> dict:
     """Identify all media files in a directory.
 
     Args:
-        directory: Directory path to scan
+        directory: Directory path to scan (within the media root or ingest directory)
     """
-    return await media.batch_identify(directory)
+    if not file_manager:
+        return {"error": "Ingest functionality not configured (PLEX_INGEST_DIR not set)"}
+    try:
+        file_manager.validate_path(directory)
+    except PathRestrictionError as e:
+        return {"success": False, "error": str(e)}
+    files = await asyncio.to_thread(file_manager.list_files, directory, True)
+    return await media.batch_identify([str(f) for f in files])
 
 
 # =============================================================================
@@ -2,9 +2,10 @@
 
 import re
 import asyncio
+import functools
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from difflib import SequenceMatcher
 
 import guessit
@@ -14,10 +15,46 @@ from server.tmdb_cache import TMDbCache
 
 logger = logging.getLogger(__name__)
 
+# guessit fields used for matching and path building (plus a few release
+# details worth surfacing); the rest are dropped from match results
+MATCH_FIELDS = frozenset({
+    "title", "year", "season", "episode", "type",
+    "screen_size", "source", "video_codec",
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _guess(filename: str) -> Tuple[Tuple[str, Any], ...]:
+    """Run guessit once per distinct filename, freezing the result."""
+    return tuple(guessit.guessit(filename).items())
+
+
+def guess_filename(
+    filename: str,
+    fields: Optional[frozenset] = None
+) -> Dict[str, Any]:
+    """Parse a filename with guessit, reusing results for repeated names.
+
+    Args:
+        filename: Filename to parse
+        fields: Keep only these guessit fields (default: all of them)
+
+    Returns:
+        Fresh dictionary of parsed metadata (safe for the caller to modify)
+    """
+    return {
+        k: list(v) if isinstance(v, list) else v
+        for k, v in _guess(filename)
+        if fields is None or k in fields
+    }
+
 
 class MediaMatcher:
     """Match media files using guessit parsing and TMDb search."""
 
+    # Maximum files matched concurrently by batch_match
+    BATCH_CONCURRENCY = 16
+
     def __init__(
         self,
         tmdb_api_key: str,
@@ -43,12 +80,11 @@ class MediaMatcher:
             filename: Filename to parse
 
         Returns:
-            Parsed metadata dictionary
+            Parsed metadata dictionary limited to MATCH_FIELDS
         """
         # Run guessit in executor since it's CPU-bound
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, guessit.guessit, filename)
-        return dict(result)
+        return await loop.run_in_executor(None, guess_filename, filename, MATCH_FIELDS)
 
     async def search_tmdb(
         self,
@@ -330,24 +366,63 @@ class MediaMatcher:
         """
         # Parse filename
         parsed = await self.parse_filename(filename)
+        return await self._match_parsed(filename, parsed)
 
-        if not parsed.get("title"):
+    @staticmethod
+    def _search_key(parsed: Dict[str, Any]) -> tuple:
+        """Return the (title, year, media_type) cache key for parsed metadata."""
+        media_type = "tv" if parsed.get("type") == "episode" else "movie"
+        return (parsed["title"], parsed.get("year"), media_type)
+
+    @classmethod
+    def _batch_key(cls, parsed: Dict[str, Any]) -> Optional[tuple]:
+        """Return the cache key for a batch prefetch, or None if it has none.
+
+        guessit reports ambiguous fields as lists (e.g. two years in one
+        name); those parses skip the prefetch and are matched on their own.
+        """
+        title, year = parsed.get("title"), parsed.get("year")
+        if not isinstance(title, str) or not title:
+            return None
+        if year is not None and not isinstance(year, int):
             return None
+        return cls._search_key(parsed)
 
-        # Determine media type
-        media_type = "tv" if parsed.get("type") == "episode" else "movie"
+    async def _match_parsed(
+        self,
+        filename: str,
+        parsed: Dict[str, Any],
+        cached: Any = None
+    ) -> Optional[Dict[str, Any]]:
+        """Match already-parsed metadata against TMDb.
 
-        # Search TMDb
-        try:
-            results = await self.search_tmdb(
-                title=parsed["title"],
-                year=parsed.get("year"),
-                media_type=media_type
-            )
-        except Exception as exc:
-            logger.warning("TMDb lookup failed while matching %r: %s", filename, exc)
+        Args:
+            filename: Original filename
+            parsed: Parsed metadata from guessit
+            cached: Cached TMDb results for this file, if already fetched
+
+        Returns:
+            Match result or None if no match found
+        """
+        if not parsed.get("title"):
             return None
 
+        title, year, media_type = self._search_key(parsed)
+
+        if cached:
+            results = cached if isinstance(cached, list) else [cached]
+        else:
+            # Search TMDb
+            try:
+                results = await self.search_tmdb(
+                    title=title,
+                    year=year,
+                    media_type=media_type
+                )
+            except Exception as exc:
+                logger.warning("TMDb lookup failed while matching %r: %s", filename, exc)
+                return None
+
         if not results:
             return None
 
@@ -375,5 +450,28 @@ class MediaMatcher:
         Returns:
             List of match results (None for failed matches)
         """
-        tasks = [self.match_media(filename) for filename in filenames]
+        parsed_all = await asyncio.gather(
+            *(self.parse_filename(filename) for filename in filenames)
+        )
+
+        # One cache round-trip for the whole batch; only misses hit TMDb
+        cached: Dict[tuple, Any] = {}
+        if self.cache:
+            keys = [key for key in map(self._batch_key, parsed_all) if key]
+            if keys:
+                cached = await self.cache.get_many(keys)
+
+        # Cap concurrent TMDb lookups so large batches don't trip rate limits
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+        async def match_one(filename: str, parsed: Dict[str, Any]):
+            key = self._batch_key(parsed)
+            hit = cached.get(key) if key else None
+            async with semaphore:
+                return await self._match_parsed(filename, parsed, hit)
+
+        tasks = [
+            match_one(filename, parsed)
+            for filename, parsed in zip(filenames, parsed_all)
+        ]
         return await asyncio.gather(*tasks, return_exceptions=False)
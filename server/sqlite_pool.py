@@ -0,0 +1,97 @@
+"""Read-only aiosqlite connection pool shared by the SQLite-backed stores.
+
+Under WAL, SQLite allows one writer alongside any number of readers, but a
+single aiosqlite connection funnels everything through one thread. Stores
+keep their own writer connection and borrow readers from this pool.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Sequence
+
+import aiosqlite
+
+
+class SQLiteReaderPool:
+    """Fixed-size pool of read-only aiosqlite connections.
+
+    Attributes:
+        db_path: Path to the SQLite database file
+        size: Number of reader connections
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        size: int = 2,
+        pragmas: Sequence[str] = ("PRAGMA mmap_size=268435456",)
+    ):
+        """Initialize the pool (connections are opened by open()).
+
+        Args:
+            db_path: Path to the SQLite database file
+            size: Number of reader connections
+            pragmas: Statements executed on each new reader connection
+        """
+        self.db_path = Path(db_path)
+        self.size = size
+        self.pragmas = tuple(pragmas)
+        self._queue: Optional[asyncio.Queue] = None
+        self._conns: List[aiosqlite.Connection] = []
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the pool has open connections."""
+        return self._queue is not None
+
+    async def open(self):
+        """Open the reader connections.
+
+        Does nothing if the pool is already open, if size is zero, or for
+        in-memory databases (which other connections cannot see).
+        """
+        if self._queue is not None or self.size <= 0:
+            return
+        if str(self.db_path) == ":memory:":
+            return
+
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        queue: asyncio.Queue = asyncio.Queue()
+        for _ in range(self.size):
+            conn = await aiosqlite.connect(uri, uri=True)
+            for pragma in self.pragmas:
+                await conn.execute(pragma)
+            self._conns.append(conn)
+            queue.put_nowait(conn)
+        self._queue = queue
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        fallback: Optional[aiosqlite.Connection] = None
+    ) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a reader connection for the duration of the block.
+
+        Args:
+            fallback: Connection to yield when the pool is not open
+
+        Yields:
+            A read-only connection, or fallback if the pool is closed
+        """
+        if self._queue is None:
+            yield fallback
+            return
+        queue = self._queue
+        conn = await queue.get()
+        try:
+            yield conn
+        finally:
+            queue.put_nowait(conn)
+
+    async def close(self):
+        """Close every reader connection."""
+        conns, self._conns = self._conns, []
+        self._queue = None
+        for conn in conns:
+            await conn.close()
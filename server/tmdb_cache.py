@@ -1,44 +1,256 @@
 """SQLite-backed cache for TMDb API results."""
 
 import json
+import time
+import asyncio
+import logging
 import aiosqlite
-from datetime import datetime, timedelta
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+from server.sqlite_pool import SQLiteReaderPool
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+if orjson is not None:
+    _dumps_result = orjson.dumps
+    _loads_result = orjson.loads
+else:
+    def _dumps_result(result: Any) -> bytes:
+        """Serialize a result to UTF-8 JSON bytes."""
+        return json.dumps(result).encode()
+
+    _loads_result = json.loads
+
+
+_GET_SQL = """
+    SELECT result, created_at FROM tmdb_cache
+    WHERE title = ? AND year IS ? AND media_type = ?
+"""
+
+_UPSERT_SQL = """
+    INSERT OR REPLACE INTO tmdb_cache (title, year, media_type, result, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# get_many() statements keyed by the number of keys they bind
+_GET_MANY_SQL_CACHE: Dict[int, str] = {}
+
+
+def _get_many_sql(size: int) -> str:
+    """Return the multi-key lookup statement for size keys, building it once."""
+    query = _GET_MANY_SQL_CACHE.get(size)
+    if query is None:
+        values = ", ".join(["(?, ?, ?)"] * size)
+        query = f"""
+            WITH wanted(title, year, media_type) AS (VALUES {values})
+            SELECT c.title, c.year, c.media_type, c.result, c.created_at
+            FROM wanted w
+            JOIN tmdb_cache c
+              ON c.title = w.title AND c.year IS w.year
+             AND c.media_type = w.media_type
+        """
+        _GET_MANY_SQL_CACHE[size] = query
+    return query
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over hashable keys.
+
+    Answers "definitely absent" or "possibly present"; entries cannot be
+    removed, so it is rebuilt from the table when the cache is opened.
+    """
+
+    def __init__(self, bits: int, hashes: int):
+        self._mask = bits - 1  # bits must be a power of two
+        self._hashes = hashes
+        self._bits = bytearray(bits >> 3)
+
+    def _positions(self, key: Tuple):
+        # Double hashing: derive every probe from one 64-bit hash
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        mask = self._mask
+        return [(h1 + i * h2) & mask for i in range(self._hashes)]
+
+    def add(self, key: Tuple):
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: Tuple) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def clear(self):
+        self._bits = bytearray(len(self._bits))
 
 
 class TMDbCache:
-    """SQLite cache for TMDb API results with TTL support."""
+    """SQLite cache for TMDb API results with TTL support.
+
+    Writes are coalesced: store() records the entry in memory and a
+    background flush writes every pending entry in one transaction shortly
+    afterwards. Reads consult the pending entries first, so a stored result
+    is visible immediately.
+
+    A single writer connection handles every write; lookups borrow one of
+    reader_count read-only connections so concurrent gets don't queue on
+    the writer's thread.
+
+    Recently used entries are also memoized in process as decoded objects,
+    so hot titles skip SQLite and JSON decoding entirely. Results returned
+    by get() may be shared between callers and should be treated as
+    read-only.
+
+    Titles are case-folded in Python with str.lower() rather than by a
+    COLLATE NOCASE column: NOCASE only folds ASCII, and the memo and
+    pending-write overlays need the folded key anyway.
 
-    def __init__(self, db_path: Path | str, ttl_days: int = 30):
+    A Bloom filter of every stored key lets lookups for titles never seen
+    before return without touching SQLite. It is built when the cache is
+    opened, so rows written by another process afterwards read as misses
+    until the next restart.
+    """
+
+    # Seconds to wait for more writes before flushing a batch
+    FLUSH_INTERVAL = 0.02
+    # Pending writes that trigger an immediate flush
+    FLUSH_BATCH_SIZE = 64
+    # Maximum number of decoded entries kept in the in-process memo
+    MEMO_SIZE = 2048
+    # Seconds between background sweeps of expired entries
+    VACUUM_INTERVAL = 600
+    # Keys bound per get_many() query (three parameters each)
+    GET_MANY_CHUNK = 300
+    # Bloom filter size (1 MiB of bits) and probes per key: about 2% false
+    # positives at one million entries
+    BLOOM_BITS = 1 << 23
+    BLOOM_HASHES = 6
+
+    def __init__(self, db_path: Path | str, ttl_days: int = 30, reader_count: int = 4):
         """Initialize TMDb cache.
 
         Args:
             db_path: Path to SQLite database file
             ttl_days: Time-to-live in days (default 30 days)
+            reader_count: Number of read-only connections (0 to read via the writer)
         """
         self.db_path = Path(db_path)
         self.ttl_days = ttl_days
+        self._ttl_seconds = ttl_days * 86400.0
         self._conn: Optional[aiosqlite.Connection] = None
+        self._readers = SQLiteReaderPool(self.db_path, size=reader_count, pragmas=(
+            "PRAGMA cache_size=-64000",
+            "PRAGMA mmap_size=268435456",
+        ))
+
+        # Writes not yet committed, keyed by (title_lower, year, media_type)
+        self._pending_writes: Dict[Tuple, Tuple[bytes, int]] = {}
+        # Batch currently being written by flush()
+        self._inflight_writes: Dict[Tuple, Tuple[bytes, int]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._vacuum_task: Optional[asyncio.Task] = None
+
+        # LRU of decoded results: key -> (result, created_at)
+        self._memo: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        # Every key known to be stored, for negative lookups
+        self._bloom = _BloomFilter(self.BLOOM_BITS, self.BLOOM_HASHES)
 
     async def initialize(self):
         """Initialize database and create tables if needed."""
         self._conn = await aiosqlite.connect(self.db_path)
+
+        # Lets the expiry sweep hand freed pages back with PRAGMA
+        # incremental_vacuum. It must be set before the switch to WAL, which
+        # silently ignores it; existing files are converted below.
+        await self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        # Read-heavy cache: WAL lets reads proceed alongside writes, and
+        # synchronous=NORMAL drops the per-commit fsync of the main file
+        await self._conn.execute("PRAGMA journal_mode=WAL")
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
+        await self._conn.execute("PRAGMA temp_store=MEMORY")
+        await self._conn.execute("PRAGMA cache_size=-64000")
+        await self._conn.execute("PRAGMA mmap_size=268435456")
+
         await self._conn.execute("""
             CREATE TABLE IF NOT EXISTS tmdb_cache (
                 title TEXT NOT NULL,
                 year INTEGER,
                 media_type TEXT NOT NULL,
-                result TEXT NOT NULL,
-                created_at REAL NOT NULL,
+                result BLOB NOT NULL,
+                created_at INTEGER NOT NULL,
                 PRIMARY KEY (title, year, media_type)
             )
         """)
+
+        # get_stats counts by media_type; expiry sweeps range-scan created_at
+        await self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_media_type
+            ON tmdb_cache(media_type)
+        """)
+        await self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_created_at
+            ON tmdb_cache(created_at)
+        """)
         await self._conn.commit()
 
+        # Files created without incremental auto_vacuum (including by older
+        # versions, which set it after WAL) need one VACUUM to switch over
+        async with self._conn.execute("PRAGMA auto_vacuum") as cursor:
+            (auto_vacuum,) = await cursor.fetchone()
+        if auto_vacuum != 2:
+            await self._conn.execute("VACUUM")
+
+        self._bloom.clear()
+        async with self._conn.execute(
+            "SELECT title, year, media_type FROM tmdb_cache"
+        ) as cursor:
+            async for row in cursor:
+                self._bloom.add(tuple(row))
+
+        await self._readers.open()
+
+        if self.ttl_days >= 0:
+            self._vacuum_task = asyncio.get_running_loop().create_task(
+                self._vacuum_loop()
+            )
+
     async def close(self):
-        """Close database connection."""
+        """Flush pending writes and close database connection."""
+        # Let a scheduled flush run to completion: cancelling it inside its
+        # transaction would skip the rollback and re-queue, losing the batch.
+        # _delayed_flush logs its own errors.
+        if self._flush_task is not None:
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        if self._vacuum_task is not None:
+            # Holding the flush lock waits out a sweep in progress, so the
+            # cancellation lands in the loop's sleep rather than mid-write
+            async with self._flush_lock:
+                self._vacuum_task.cancel()
+            try:
+                await self._vacuum_task
+            except asyncio.CancelledError:
+                pass
+            self._vacuum_task = None
+
+        await self._readers.close()
+
         if self._conn:
+            await self.flush()
             await self._conn.close()
             self._conn = None
 
@@ -51,21 +263,44 @@ class TMDbCache:
     ):
         """Store a TMDb result in cache.
 
+        The entry is readable immediately; it is written to SQLite by the
+        next batch flush.
+
         Args:
             title: Media title (case-insensitive)
             year: Release year (optional)
             media_type: "movie" or "tv"
             result: TMDb API result (dict or list)
         """
-        title_lower = title.lower()
-        result_json = json.dumps(result)
-        created_at = datetime.now().timestamp()
+        key = (title.lower(), year, media_type)
+        created_at = int(time.time())
+        self._remember(key, result, created_at)
+        self._bloom.add(key)
+        self._pending_writes[key] = (_dumps_result(result), created_at)
 
-        await self._conn.execute("""
-            INSERT OR REPLACE INTO tmdb_cache (title, year, media_type, result, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (title_lower, year, media_type, result_json, created_at))
-        await self._conn.commit()
+        if len(self._pending_writes) >= self.FLUSH_BATCH_SIZE:
+            await self.flush()
+        else:
+            self._schedule_flush()
+
+    async def store_many(
+        self,
+        rows: List[Tuple[str, Optional[int], str, Any]]
+    ):
+        """Store several TMDb results and write them in one transaction.
+
+        Args:
+            rows: (title, year, media_type, result) tuples
+        """
+        created_at = int(time.time())
+        for title, year, media_type, result in rows:
+            key = (title.lower(), year, media_type)
+            self._remember(key, result, created_at)
+            self._bloom.add(key)
+            self._pending_writes[key] = (_dumps_result(result), created_at)
+
+        if rows:
+            await self.flush()
 
     async def get(
         self,
@@ -80,43 +315,207 @@ class TMDbCache:
             year: Release year (optional)
             media_type: "movie" or "tv"
 
+        Expired entries are reported as misses but left in place; the
+        background sweep removes them.
+
         Returns:
             Cached result or None if not found or expired
         """
-        title_lower = title.lower()
+        key = (title.lower(), year, media_type)
 
-        cursor = await self._conn.execute("""
-            SELECT result, created_at FROM tmdb_cache
-            WHERE title = ? AND year IS ? AND media_type = ?
-        """, (title_lower, year, media_type))
+        memo = self._memo.get(key)
+        if memo is not None:
+            result, created_at = memo
+            if self._is_expired(created_at):
+                del self._memo[key]
+                return None
+            self._memo.move_to_end(key)
+            return result
 
-        row = await cursor.fetchone()
+        row = self._pending_writes.get(key) or self._inflight_writes.get(key)
+        if row is None:
+            if key not in self._bloom:
+                return None
+
+            async with self._readers.acquire(fallback=self._conn) as conn:
+                cursor = await conn.execute(_GET_SQL, key)
+
+                row = await cursor.fetchone()
 
         if not row:
             return None
 
         result_json, created_at = row
 
-        # Check TTL
-        if self.ttl_days >= 0:
-            created_dt = datetime.fromtimestamp(created_at)
-            expires_at = created_dt + timedelta(days=self.ttl_days)
-
-            if datetime.now() > expires_at:
-                # Expired - remove and return None
-                await self._conn.execute("""
-                    DELETE FROM tmdb_cache
-                    WHERE title = ? AND year IS ? AND media_type = ?
-                """, (title_lower, year, media_type))
+        if self._is_expired(created_at):
+            return None
+
+        result = _loads_result(result_json)
+        self._remember(key, result, created_at)
+        return result
+
+    async def get_many(
+        self,
+        keys: List[Tuple[str, Optional[int], str]]
+    ) -> Dict[Tuple[str, Optional[int], str], Any]:
+        """Retrieve several TMDb results with a single query.
+
+        Args:
+            keys: (title, year, media_type) tuples to look up
+
+        Returns:
+            Dictionary mapping each key that was found (and not expired)
+            to its cached result; misses are omitted
+        """
+        found: Dict[Tuple, Any] = {}
+        # Normalized key -> caller keys that map to it
+        wanted: Dict[Tuple, List[Tuple]] = {}
+
+        for key in keys:
+            title, year, media_type = key
+            norm = (title.lower(), year, media_type)
+
+            memo = self._memo.get(norm)
+            if memo is not None:
+                result, created_at = memo
+                if self._is_expired(created_at):
+                    del self._memo[norm]
+                else:
+                    self._memo.move_to_end(norm)
+                    found[key] = result
+                continue
+
+            row = self._pending_writes.get(norm) or self._inflight_writes.get(norm)
+            if row is not None:
+                result_json, created_at = row
+                if not self._is_expired(created_at):
+                    result = _loads_result(result_json)
+                    self._remember(norm, result, created_at)
+                    found[key] = result
+                continue
+
+            if norm in self._bloom:
+                wanted.setdefault(norm, []).append(key)
+
+        if not wanted:
+            return found
+
+        norms = list(wanted)
+        async with self._readers.acquire(fallback=self._conn) as conn:
+            for start in range(0, len(norms), self.GET_MANY_CHUNK):
+                chunk = norms[start:start + self.GET_MANY_CHUNK]
+                # Pad to a power of two (repeating the last key) so only a
+                # handful of distinct statements compete for the
+                # connection's prepared-statement cache
+                size = min(1 << (len(chunk) - 1).bit_length(), self.GET_MANY_CHUNK)
+                chunk += [chunk[-1]] * (size - len(chunk))
+                cursor = await conn.execute(
+                    _get_many_sql(size), [param for norm in chunk for param in norm]
+                )
+
+                for title, year, media_type, result_json, created_at in await cursor.fetchall():
+                    if self._is_expired(created_at):
+                        continue
+                    norm = (title, year, media_type)
+                    result = _loads_result(result_json)
+                    self._remember(norm, result, created_at)
+                    for key in wanted.get(norm, ()):
+                        found[key] = result
+
+        return found
+
+    def _is_expired(self, created_at: float) -> bool:
+        """Check whether an entry created at created_at is past its TTL."""
+        return self.ttl_days >= 0 and time.time() - created_at > self._ttl_seconds
+
+    def _remember(self, key: Tuple, result: Any, created_at: int):
+        """Insert a decoded entry into the memo, evicting the oldest if full."""
+        self._memo[key] = (result, created_at)
+        self._memo.move_to_end(key)
+        if len(self._memo) > self.MEMO_SIZE:
+            self._memo.popitem(last=False)
+
+    async def flush(self):
+        """Write all pending cache changes in a single transaction."""
+        async with self._flush_lock:
+            if not self._pending_writes:
+                return
+
+            writes, self._pending_writes = self._pending_writes, {}
+            self._inflight_writes = writes
+
+            try:
+                await self._conn.execute("BEGIN IMMEDIATE")
+                await self._conn.executemany(
+                    _UPSERT_SQL, [key + value for key, value in writes.items()]
+                )
                 await self._conn.commit()
-                return None
+            except Exception:
+                await self._conn.rollback()
+                # Put the batch back unless newer writes superseded it
+                for key, value in writes.items():
+                    self._pending_writes.setdefault(key, value)
+                raise
+            finally:
+                self._inflight_writes = {}
+
+    def _schedule_flush(self):
+        """Start a delayed flush unless one is already scheduled."""
+        if self._conn is None:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._delayed_flush()
+            )
+
+    async def _delayed_flush(self):
+        """Wait briefly so concurrent writes share one commit, then flush."""
+        await asyncio.sleep(self.FLUSH_INTERVAL)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning("TMDb cache flush failed: %s", e)
 
-        return json.loads(result_json)
+    async def sweep_expired(self) -> int:
+        """Delete every entry past its TTL in one statement.
+
+        Returns:
+            Number of entries removed
+        """
+        if self.ttl_days < 0:
+            return 0
+        cutoff = time.time() - self._ttl_seconds
+
+        async with self._flush_lock:
+            cursor = await self._conn.execute(
+                "DELETE FROM tmdb_cache WHERE created_at < ?", (cutoff,)
+            )
+            await self._conn.commit()
+            await self._conn.execute("PRAGMA incremental_vacuum")
+
+        for key in [k for k, (_, created_at) in self._memo.items() if created_at < cutoff]:
+            del self._memo[key]
+        return cursor.rowcount
+
+    async def _vacuum_loop(self):
+        """Periodically sweep expired entries until cancelled."""
+        while True:
+            await asyncio.sleep(self.VACUUM_INTERVAL)
+            try:
+                removed = await self.sweep_expired()
+                if removed:
+                    logger.debug("Swept %d expired TMDb cache entries", removed)
+            except Exception as e:
+                logger.warning("TMDb cache expiry sweep failed: %s", e)
 
     async def clear(self):
         """Clear all cache entries."""
-        await self._conn.execute("DELETE FROM tmdb_cache")
-        await self._conn.commit()
+        async with self._flush_lock:
+            self._memo.clear()
+            self._pending_writes.clear()
+            self._bloom.clear()
+            await self._conn.execute("DELETE FROM tmdb_cache")
+            await self._conn.commit()
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -124,18 +523,21 @@ class TMDbCache:
         Returns:
             Dictionary with cache stats
         """
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM tmdb_cache")
-        total = (await cursor.fetchone())[0]
-
-        cursor = await self._conn.execute(
-            "SELECT COUNT(*) FROM tmdb_cache WHERE media_type = 'movie'"
-        )
-        movie_count = (await cursor.fetchone())[0]
-
-        cursor = await self._conn.execute(
-            "SELECT COUNT(*) FROM tmdb_cache WHERE media_type = 'tv'"
-        )
-        tv_count = (await cursor.fetchone())[0]
+        await self.flush()
+
+        async with self._readers.acquire(fallback=self._conn) as conn:
+            cursor = await conn.execute("SELECT COUNT(*) FROM tmdb_cache")
+            total = (await cursor.fetchone())[0]
+
+            cursor = await conn.execute(
+                "SELECT COUNT(*) FROM tmdb_cache WHERE media_type = 'movie'"
+            )
+            movie_count = (await cursor.fetchone())[0]
+
+            cursor = await conn.execute(
+                "SELECT COUNT(*) FROM tmdb_cache WHERE media_type = 'tv'"
+            )
+            tv_count = (await cursor.fetchone())[0]
 
         return {
             "total_entries": total,
@@ -2,38 +2,33 @@
 
 import os
 from typing import Dict, Any, List, Optional
-from pathlib import Path
 
-import guessit
-
-from server.matcher import MediaMatcher
-from server.tmdb_cache import TMDbCache
+from server.matcher import MediaMatcher, guess_filename
 
 
 # Global matcher instance
 _matcher: Optional[MediaMatcher] = None
 
 
-def get_matcher() -> MediaMatcher:
-    """Get or create global MediaMatcher instance."""
+def set_matcher(matcher: MediaMatcher) -> None:
+    """Install the server's MediaMatcher (and its initialized cache) for the tools."""
     global _matcher
+    _matcher = matcher
 
-    if _matcher is None:
-        tmdb_api_key = os.getenv("TMDB_API_KEY", "")
-        media_root = os.getenv("PLEX_MEDIA_ROOT", "/data/media")
 
-        # Initialize cache
-        cache_dir = Path.home() / ".cache" / "plex-mcp"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_path = cache_dir / "tmdb_cache.db"
+def get_matcher() -> MediaMatcher:
+    """Get the global MediaMatcher, creating an uncached one if none is set.
 
-        cache = TMDbCache(cache_path, ttl_days=30)
+    The server installs its matcher with set_matcher() at startup so the
+    tools share one initialized TMDbCache. The fallback has no cache: a
+    TMDbCache can only be opened from async code.
+    """
+    global _matcher
 
-        # Note: cache.initialize() must be called async, will be done in main.py
+    if _matcher is None:
         _matcher = MediaMatcher(
-            tmdb_api_key=tmdb_api_key,
-            cache=cache,
-            media_root=media_root
+            tmdb_api_key=os.getenv("TMDB_API_KEY", ""),
+            media_root=os.getenv("PLEX_MEDIA_ROOT", "/data/media")
         )
 
     return _matcher
@@ -49,8 +44,7 @@ async def parse_filename(filename: str) -> Dict[str, Any]:
         Dictionary with success status and parsed metadata or error
     """
     try:
-        result = guessit.guessit(filename)
-        parsed = dict(result)
+        parsed = guess_filename(filename)
 
         return {
             "success": True,
@@ -83,22 +77,27 @@ async def search_tmdb(
     try:
         matcher = get_matcher()
         results = await matcher.search_tmdb(title, year, media_type)
+        query = {
+            "title": title,
+            "year": year,
+            "media_type": media_type
+        }
 
-        response = {
+        if not results:
+            return {
+                "success": True,
+                "query": query,
+                "results": [],
+                "count": 0,
+                "message": "No results found"
+            }
+
+        return {
             "success": True,
-            "query": {
-                "title": title,
-                "year": year,
-                "media_type": media_type
-            },
+            "query": query,
             "results": results,
             "count": len(results)
         }
-
-        if not results:
-            response["message"] = "No results found"
-
-        return response
     except Exception as e:
         return {
             "success": False,
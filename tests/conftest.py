@@ -1,12 +1,25 @@
 """Shared pytest fixtures for Plex Claude Plugin tests."""
 
+import os
 import pytest
 import tempfile
 import shutil
+import uuid
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
 from typing import Dict, Any
 
+from server.history import IngestHistory
+from server.matcher import _guess
+
+
+@pytest.fixture(autouse=True)
+def clear_guess_cache():
+    """Drop memoized guessit results so patched parsers take effect."""
+    _guess.cache_clear()
+    yield
+    _guess.cache_clear()
+
 
 # =============================================================================
 # Mock Plex Server Fixtures
@@ -171,10 +184,14 @@ def mock_guessit_tv() -> Dict[str, Any]:
 # Temporary Directory Fixtures
 # =============================================================================
 
+# RAM-backed tmpfs on Linux, so test trees and databases never touch disk
+_TEMP_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK | os.X_OK) else None
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory that is cleaned up after the test."""
-    temp_path = tempfile.mkdtemp()
+    temp_path = tempfile.mkdtemp(dir=_TEMP_ROOT)
     yield Path(temp_path)
     shutil.rmtree(temp_path)
 
@@ -231,6 +248,23 @@ async def temp_db(temp_dir):
     # Cleanup happens automatically with temp_dir
 
 
+@pytest.fixture
+def memory_db_path():
+    """URI of a private in-memory SQLite database.
+
+    Shared-cache mode lets every connection opened on the URI see the same
+    database; it disappears once the last connection closes.
+    """
+    return f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+@pytest.fixture
+async def history(memory_db_path):
+    """Initialized IngestHistory on a private in-memory database."""
+    async with IngestHistory(memory_db_path) as history:
+        yield history
+
+
 # =============================================================================
 # Environment Variable Fixtures
 # =============================================================================
@@ -5,6 +5,8 @@ from unittest.mock import MagicMock, patch, AsyncMock
 import asyncio
 from typing import Protocol
 
+from plexapi.exceptions import NotFound
+
 from server.client import PlexClient, create_plex_client, PlexAPIClient
 
 
@@ -187,12 +189,28 @@ async def test_get_server_info_async_wrapping(mock_plex_server):
     assert result["machineIdentifier"] == "test-machine-id"
 
 
+@pytest.mark.asyncio
+async def test_get_server_info_is_cached(mock_plex_server):
+    """get_server_info should fetch server metadata once, even when called concurrently."""
+    client = PlexAPIClient(mock_plex_server)
+
+    with patch.object(
+        client, "_sync_get_server_info", wraps=client._sync_get_server_info
+    ) as fetch:
+        results = await asyncio.gather(*(client.get_server_info() for _ in range(5)))
+        again = await client.get_server_info()
+
+    assert fetch.call_count == 1
+    assert all(r == again for r in results)
+    again["name"] = "changed"
+    assert (await client.get_server_info())["name"] != "changed"
+
+
 @pytest.mark.asyncio
 async def test_scan_library_section_not_found(mock_plex_server):
     """scan_library should raise error when section not found."""
     client = PlexAPIClient(mock_plex_server)
 
-    from plexapi.exceptions import NotFound
     mock_plex_server.library.section.side_effect = NotFound("Section not found")
 
     with pytest.raises(NotFound):
@@ -204,7 +222,6 @@ async def test_search_library_section_not_found(mock_plex_server):
     """search_library should raise error when section not found."""
     client = PlexAPIClient(mock_plex_server)
 
-    from plexapi.exceptions import NotFound
     mock_plex_server.library.section.side_effect = NotFound("Section not found")
 
     with pytest.raises(NotFound):
@@ -216,8 +233,28 @@ async def test_list_recent_section_not_found(mock_plex_server):
     """list_recent should raise error when section not found."""
     client = PlexAPIClient(mock_plex_server)
 
-    from plexapi.exceptions import NotFound
     mock_plex_server.library.section.side_effect = NotFound("Section not found")
 
     with pytest.raises(NotFound):
         await client.list_recent("999", 10)
+
+
+@pytest.mark.asyncio
+async def test_search_library_does_not_reload_partial_items(mock_plex_server):
+    """search_library should report a missing year without fetching the full item."""
+    import xml.etree.ElementTree as ET
+    from plexapi.video import Movie
+
+    # A partial listing item with no year and no server: reading item.year
+    # directly would attempt an auto-reload and fail
+    movie = Movie(
+        None,
+        ET.fromstring('<Video type="movie" title="Untitled" ratingKey="1" key="/library/metadata/1"/>'),
+        initpath="/library/sections/1/all",
+    )
+    mock_plex_server.library.sectionByID.return_value.search.return_value = [movie]
+    client = PlexAPIClient(mock_plex_server)
+
+    result = await client.search_library("1", "Untitled")
+
+    assert result == [{"title": "Untitled", "year": None, "type": "movie"}]
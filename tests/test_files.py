@@ -1,7 +1,11 @@
 """Tests for FileManager - file operations with path restrictions and extension whitelist."""
 
+import errno
+import os
+import shutil
 import pytest
 from pathlib import Path
+from server import files
 from server.files import FileManager, FileOperationError, InvalidExtensionError, PathRestrictionError
 
 
@@ -60,6 +64,14 @@ class TestExtensionValidation:
         assert fm.is_valid_extension(Path("test.Mp4")) is True
         assert fm.is_valid_extension(Path("test.AVI")) is True
 
+    def test_string_paths_match_path_suffix_rules(self, temp_media_root, temp_ingest_dir):
+        """Should treat string paths the same way as Path.suffix."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        assert fm.is_valid_extension("/downloads/Movie.2010.MKV") is True
+        assert fm.is_valid_extension("/downloads/show.mkv/readme") is False
+        assert fm.is_valid_extension("/downloads/.mkv") is False
+        assert fm.is_valid_extension("movie.mkv.") is False
+
 
 class TestPathRestrictions:
     """Test path restriction enforcement."""
@@ -101,6 +113,72 @@ class TestPathRestrictions:
         with pytest.raises(PathRestrictionError):
             fm.validate_path(traversal_path, require_ingest=True)
 
+    def test_reject_traversal_without_resolving(self, temp_media_root, temp_ingest_dir, monkeypatch):
+        """Should reject lexical traversal before touching the filesystem."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+
+        def no_resolve(path):
+            raise AssertionError("resolved a path rejected lexically")
+
+        monkeypatch.setattr(files, "_resolve", no_resolve)
+
+        with pytest.raises(PathRestrictionError):
+            fm.validate_path(temp_ingest_dir / ".." / ".." / "etc" / "passwd")
+
+    def test_reject_sibling_with_shared_prefix(self, temp_media_root, temp_ingest_dir, temp_dir):
+        """Should not treat a sibling directory sharing a name prefix as inside the root."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        sibling = temp_dir / "ingest-other" / "movie.mkv"
+
+        with pytest.raises(PathRestrictionError):
+            fm.validate_path(sibling, require_ingest=True)
+
+    def test_reject_symlink_escape(self, temp_media_root, temp_ingest_dir, temp_dir):
+        """Should reject paths that leave the root through a symlink."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        outside = temp_dir / "outside"
+        outside.mkdir()
+        link = temp_ingest_dir / "link"
+        link.symlink_to(outside)
+
+        with pytest.raises(PathRestrictionError):
+            fm.validate_path(link / "movie.mkv", require_ingest=True)
+
+    def test_reject_symlinked_file_escape(self, temp_media_root, temp_ingest_dir, temp_dir):
+        """Should reject a file symlink pointing outside, even after its directory is cached."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        outside = temp_dir / "secret.mkv"
+        outside.write_text("x")
+        (temp_ingest_dir / "real.mkv").write_text("x")
+
+        assert fm.validate_path(temp_ingest_dir / "real.mkv", require_ingest=True) is True
+        (temp_ingest_dir / "link.mkv").symlink_to(outside)
+        with pytest.raises(PathRestrictionError):
+            fm.validate_path(temp_ingest_dir / "link.mkv", require_ingest=True)
+
+    def test_reject_directory_swapped_for_symlink(self, temp_media_root, temp_ingest_dir, temp_dir):
+        """Should reject paths through a directory replaced by an outside symlink after validation."""
+        outside = temp_dir / "outside"
+        outside.mkdir()
+        (outside / "victim.mkv").write_text("x")
+        subdir = temp_ingest_dir / "torrent"
+        subdir.mkdir()
+        (subdir / "victim.mkv").write_text("x")
+
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        assert fm.validate_path(subdir / "victim.mkv", require_ingest=True) is True
+
+        (subdir / "victim.mkv").unlink()
+        subdir.rmdir()
+        subdir.symlink_to(outside)
+
+        with pytest.raises(PathRestrictionError):
+            fm.validate_path(subdir / "victim.mkv", require_ingest=True)
+        fresh = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        with pytest.raises(PathRestrictionError):
+            fresh.delete_file(subdir / "victim.mkv")
+        assert (outside / "victim.mkv").exists()
+
 
 class TestCopyFile:
     """Test file copy operations."""
@@ -138,15 +216,134 @@ class TestCopyFile:
         assert dest.exists()
         assert dest.parent.exists()
 
+    def test_copy_file_recreates_removed_parent(self, temp_media_root, temp_ingest_dir, sample_video_file):
+        """Should recreate a remembered destination directory that was removed."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        movie_dir = temp_media_root / "Movies" / "Inception"
+        fm.copy_file(sample_video_file, movie_dir / "a.mkv")
+
+        shutil.rmtree(movie_dir)
+        result = fm.copy_file(sample_video_file, movie_dir / "b.mkv")
+
+        assert result.exists()
+
+    def test_copy_file_onto_itself(self, temp_media_root, temp_ingest_dir, sample_video_file):
+        """Should refuse to copy a file onto itself instead of truncating it."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+
+        with pytest.raises(FileOperationError, match="same file"):
+            fm.copy_file(sample_video_file, sample_video_file)
+
+        assert sample_video_file.read_text() == "fake video content"
+
     def test_copy_file_source_not_exists(self, temp_media_root, temp_ingest_dir):
         """Should raise error if source file doesn't exist."""
         fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
         source = temp_ingest_dir / "nonexistent.mkv"
         dest = temp_media_root / "Movies" / "test.mkv"
 
-        with pytest.raises(FileOperationError):
+        with pytest.raises(FileOperationError, match="does not exist"):
             fm.copy_file(source, dest)
 
+    def test_copy_file_falls_back_when_kernel_copy_unsupported(
+        self, temp_media_root, temp_ingest_dir, sample_video_file, monkeypatch
+    ):
+        """Should fall back to a buffered copy when no kernel copy is supported."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        dest = temp_media_root / "Movies" / "Inception.2010.mkv"
+
+        def unsupported(*args, **kwargs):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(files, "_reflink", lambda src_fd, dst_fd: False)
+        monkeypatch.setattr(files, "_copy_file_range", unsupported)
+        monkeypatch.setattr(files, "_sendfile", unsupported)
+
+        result = fm.copy_file(sample_video_file, dest)
+
+        assert result == dest
+        assert dest.read_text() == "fake video content"
+
+    def test_copy_file_uses_sendfile_when_copy_file_range_unsupported(
+        self, temp_media_root, temp_ingest_dir, monkeypatch
+    ):
+        """Should copy in the kernel with sendfile when copy_file_range refuses."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        source = temp_ingest_dir / "big.mkv"
+        dest = temp_media_root / "Movies" / "big.mkv"
+        payload = os.urandom(10_000)
+        source.write_bytes(payload)
+
+        def unsupported(*args, **kwargs):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        def no_buffered_copy(*args, **kwargs):
+            raise AssertionError("fell back to a userspace copy")
+
+        monkeypatch.setattr(files, "_reflink", lambda src_fd, dst_fd: False)
+        monkeypatch.setattr(files, "_copy_file_range", unsupported)
+        monkeypatch.setattr(files, "_buffered_copy", no_buffered_copy)
+
+        fm.copy_file(source, dest)
+
+        assert dest.read_bytes() == payload
+
+    def test_copy_file_falls_back_when_kernel_copy_returns_zero(
+        self, temp_media_root, temp_ingest_dir, sample_video_file, monkeypatch
+    ):
+        """Should not treat a 0 return before the full size as EOF."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        dest = temp_media_root / "Movies" / "Inception.2010.mkv"
+
+        monkeypatch.setattr(files, "_reflink", lambda src_fd, dst_fd: False)
+        monkeypatch.setattr(files.os, "copy_file_range", lambda *args: 0, raising=False)
+        monkeypatch.setattr(files.os, "sendfile", lambda *args: 0, raising=False)
+
+        fm.copy_file(sample_video_file, dest)
+
+        assert dest.read_text() == "fake video content"
+
+    def test_copy_file_sendfile_resumes_short_copy_file_range(
+        self, temp_media_root, temp_ingest_dir, monkeypatch
+    ):
+        """Should finish with sendfile from where copy_file_range stopped."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        source = temp_ingest_dir / "big.mkv"
+        dest = temp_media_root / "Movies" / "big.mkv"
+        payload = os.urandom(10_000)
+        source.write_bytes(payload)
+        real_copy_file_range = os.copy_file_range
+        calls = []
+
+        def short_copy_file_range(src_fd, dst_fd, count):
+            calls.append(count)
+            if len(calls) > 1:
+                return 0
+            return real_copy_file_range(src_fd, dst_fd, 4000)
+
+        def no_buffered_copy(*args, **kwargs):
+            raise AssertionError("fell back to a userspace copy")
+
+        monkeypatch.setattr(files, "_reflink", lambda src_fd, dst_fd: False)
+        monkeypatch.setattr(files.os, "copy_file_range", short_copy_file_range)
+        monkeypatch.setattr(files, "_buffered_copy", no_buffered_copy)
+
+        fm.copy_file(source, dest)
+
+        assert dest.read_bytes() == payload
+
+    def test_buffered_copy_spans_multiple_chunks(self, temp_ingest_dir):
+        """Should copy files larger than the buffer without truncation."""
+        source = temp_ingest_dir / "big.mkv"
+        dest = temp_ingest_dir / "copy.mkv"
+        payload = os.urandom(10_000)
+        source.write_bytes(payload)
+
+        with open(source, "rb") as fsrc, open(dest, "wb") as fdst:
+            files._copyfileobj_readinto(fsrc, fdst, bufsize=4096)
+
+        assert dest.read_bytes() == payload
+
 
 class TestMoveFile:
     """Test file move operations."""
@@ -183,6 +380,47 @@ class TestMoveFile:
         assert dest.exists()
         assert not sample_video_file.exists()
 
+    def test_move_file_across_filesystems(
+        self, temp_media_root, temp_ingest_dir, sample_video_file, monkeypatch
+    ):
+        """Should copy then unlink when rename fails with EXDEV."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        dest = temp_media_root / "Movies" / "Inception.2010.mkv"
+
+        def cross_device(src, dst):
+            raise OSError(errno.EXDEV, "cross-device link")
+
+        monkeypatch.setattr(files.os, "rename", cross_device)
+
+        result = fm.move_file(sample_video_file, dest)
+
+        assert result == dest
+        assert dest.read_text() == "fake video content"
+        assert not sample_video_file.exists()
+
+    def test_move_file_across_filesystems_cleans_up_failed_copy(
+        self, temp_media_root, temp_ingest_dir, sample_video_file, monkeypatch
+    ):
+        """Should keep the source and drop the partial copy if the fallback copy fails."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        dest = temp_media_root / "Movies" / "Inception.2010.mkv"
+
+        def cross_device(src, dst):
+            raise OSError(errno.EXDEV, "cross-device link")
+
+        def failing_copy(src, dst):
+            Path(dst).write_text("partial")
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(files.os, "rename", cross_device)
+        monkeypatch.setattr(files, "_fast_copy", failing_copy)
+
+        with pytest.raises(FileOperationError):
+            fm.move_file(sample_video_file, dest)
+
+        assert sample_video_file.exists()
+        assert not dest.exists()
+
 
 class TestRenameFile:
     """Test file rename operations."""
@@ -239,10 +477,67 @@ class TestDeleteFile:
         fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
         nonexistent = temp_ingest_dir / "nonexistent.mkv"
 
-        with pytest.raises(FileOperationError):
+        with pytest.raises(FileOperationError, match="does not exist"):
             fm.delete_file(nonexistent)
 
 
+class TestBatchOperations:
+    """Test batch copy, move, and delete operations."""
+
+    def _make_files(self, directory, count):
+        paths = []
+        for i in range(count):
+            path = directory / f"Show.S01E{i:02d}.mkv"
+            path.write_text(f"episode {i}")
+            paths.append(path)
+        return paths
+
+    def test_copy_files(self, temp_media_root, temp_ingest_dir):
+        """Should copy every pair and return destinations in order."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        sources = self._make_files(temp_ingest_dir, 4)
+        pairs = [(src, temp_media_root / "TV Shows" / "Show" / src.name) for src in sources]
+
+        result = fm.copy_files(pairs)
+
+        assert result == [dest for _, dest in pairs]
+        assert [dest.read_text() for _, dest in pairs] == [f"episode {i}" for i in range(4)]
+        assert all(src.exists() for src in sources)
+
+    def test_move_files(self, temp_media_root, temp_ingest_dir):
+        """Should move every pair."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        sources = self._make_files(temp_ingest_dir, 3)
+        pairs = [(src, temp_media_root / "TV Shows" / src.name) for src in sources]
+
+        fm.move_files(pairs)
+
+        assert all(dest.exists() for _, dest in pairs)
+        assert not any(src.exists() for src in sources)
+
+    def test_copy_files_validates_before_copying(self, temp_media_root, temp_ingest_dir, temp_dir):
+        """Should reject the batch before copying anything if one path is invalid."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        sources = self._make_files(temp_ingest_dir, 2)
+        pairs = [
+            (sources[0], temp_media_root / sources[0].name),
+            (sources[1], temp_dir / "outside" / sources[1].name),
+        ]
+
+        with pytest.raises(PathRestrictionError):
+            fm.copy_files(pairs)
+
+        assert not (temp_media_root / sources[0].name).exists()
+
+    def test_delete_files(self, temp_media_root, temp_ingest_dir):
+        """Should delete every file and report the count."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+        paths = self._make_files(temp_ingest_dir, 3)
+
+        assert fm.delete_files(paths) == 3
+        assert not any(p.exists() for p in paths)
+
+
 class TestListFiles:
     """Test file listing operations."""
 
@@ -288,3 +583,15 @@ class TestListFiles:
 
         assert len(files) == 1
         assert files[0].name == "movie1.mkv"
+
+    def test_list_files_ignores_names_without_suffix(self, temp_media_root, temp_ingest_dir):
+        """Should not match files whose whole name equals an extension."""
+        fm = FileManager(media_root=temp_media_root, ingest_dir=temp_ingest_dir)
+
+        (temp_ingest_dir / "mkv").write_text("test")
+        (temp_ingest_dir / ".mkv").write_text("test")
+        (temp_ingest_dir / "movie.MKV").write_text("test")
+
+        files = fm.list_files(temp_ingest_dir)
+
+        assert [f.name for f in files] == ["movie.MKV"]
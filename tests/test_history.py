@@ -2,11 +2,24 @@
 
 import pytest
 import asyncio
+import aiosqlite
 from pathlib import Path
 from datetime import datetime, timedelta
 from server.history import IngestHistory, IngestStatus, IngestRecord
 
 
+@pytest.fixture
+def movie_source(temp_ingest_dir):
+    """Source path of a movie in the ingest directory, as a string."""
+    return str(temp_ingest_dir / "movie.mkv")
+
+
+@pytest.fixture
+def movie_dest(temp_media_root):
+    """Library destination for movie_source, as a string."""
+    return str(temp_media_root / "Movies" / "Movie.mkv")
+
+
 class TestIngestHistoryInitialization:
     """Test IngestHistory initialization."""
 
@@ -22,19 +35,15 @@ class TestIngestHistoryInitialization:
         await history.close()
 
     @pytest.mark.asyncio
-    async def test_initialize_creates_tables(self, temp_dir):
-        """Should create ingest_records table with correct schema."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-
-        await history.initialize()
+    async def test_initialize_creates_tables(self, memory_db_path):
+        """Should create the schema on entering the context and close on exit."""
+        async with IngestHistory(memory_db_path) as history:
+            # Verify table exists by querying it
+            records = await history.get_all_records()
+            assert isinstance(records, list)
+            assert len(records) == 0
 
-        # Verify table exists by querying it
-        records = await history.get_all_records()
-        assert isinstance(records, list)
-        assert len(records) == 0
-
-        await history.close()
+        assert history._db is None
 
     @pytest.mark.asyncio
     async def test_initialize_idempotent(self, temp_dir):
@@ -48,100 +57,159 @@ class TestIngestHistoryInitialization:
         assert db_path.exists()
         await history.close()
 
-
-class TestAddRecord:
-    """Test adding ingest records."""
-
     @pytest.mark.asyncio
-    async def test_add_record_with_all_fields(self, temp_dir, temp_ingest_dir, temp_media_root):
-        """Should add complete ingest record."""
+    @pytest.mark.parametrize("reader_count", [0, 2])
+    async def test_reads_see_committed_writes(self, temp_dir, temp_ingest_dir, temp_media_root, reader_count):
+        """Should read committed records whether or not a reader pool is used."""
         db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
+        history = IngestHistory(db_path, reader_count=reader_count)
         await history.initialize()
 
-        source = temp_ingest_dir / "movie.mkv"
-        dest = temp_media_root / "Movies" / "Movie.mkv"
-
         record_id = await history.add_record(
-            source_path=source,
-            destination_path=dest,
-            tmdb_id=12345,
-            media_type="movie",
-            confidence=0.95,
+            source_path=temp_ingest_dir / "movie.mkv",
+            destination_path=temp_media_root / "movie.mkv",
             status=IngestStatus.SUCCESS
         )
 
-        assert record_id is not None
-        assert isinstance(record_id, int)
+        records = await asyncio.gather(*(history.get_record(record_id) for _ in range(5)))
+
+        assert all(r.id == record_id for r in records)
 
         await history.close()
 
     @pytest.mark.asyncio
-    async def test_add_record_minimal_fields(self, temp_dir, temp_ingest_dir, temp_media_root):
-        """Should add record with only required fields."""
+    async def test_shared_connection(self, temp_dir, temp_ingest_dir, temp_media_root):
+        """Should use an injected connection and leave it open on close."""
         db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
+        async with aiosqlite.connect(db_path) as conn:
+            writer = IngestHistory(db_path, connection=conn)
+            await writer.initialize()
+            record_id = await writer.add_record(
+                source_path=temp_ingest_dir / "movie.mkv",
+                destination_path=temp_media_root / "movie.mkv",
+                status=IngestStatus.SUCCESS
+            )
+            await writer.close()
+
+            reader = IngestHistory(db_path, connection=conn)
+            await reader.initialize()
+            record = await reader.get_record(record_id)
+            assert record is not None
+            assert reader.reader_count == 0
+
+            await conn.execute("SELECT 1")
+            await reader.close()
+
 
+class TestAddRecord:
+    """Test adding ingest records."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fields", [
+        pytest.param(
+            {"tmdb_id": 12345, "media_type": "movie", "confidence": 0.95,
+             "status": IngestStatus.SUCCESS},
+            id="all-fields"
+        ),
+        pytest.param({"status": IngestStatus.PENDING}, id="minimal-fields"),
+        pytest.param(
+            {"status": IngestStatus.SUCCESS,
+             "metadata": {"title": "Inception", "year": 2010, "resolution": "1080p"}},
+            id="metadata"
+        ),
+    ])
+    async def test_add_record(self, history, temp_ingest_dir, temp_media_root, fields):
+        """Should store the given fields, leaving the rest unset."""
         source = temp_ingest_dir / "movie.mkv"
         dest = temp_media_root / "Movies" / "Movie.mkv"
 
-        record_id = await history.add_record(
+        record = await history.add_record_returning(
             source_path=source,
             destination_path=dest,
-            status=IngestStatus.PENDING
+            **fields
         )
 
-        assert record_id is not None
-
-        # Verify record
-        record = await history.get_record(record_id)
+        assert isinstance(record.id, int)
+        assert record == await history.get_record(record.id)
         assert record.source_path == str(source)
         assert record.destination_path == str(dest)
-        assert record.status == IngestStatus.PENDING
-        assert record.tmdb_id is None
-        assert record.confidence is None
+        for name in ("status", "tmdb_id", "media_type", "confidence", "metadata"):
+            assert getattr(record, name) == fields.get(name)
 
-        await history.close()
+    @pytest.mark.asyncio
+    async def test_add_record_returns_id(self, history, movie_source, movie_dest):
+        """Should return the new record's ID, accepting string paths."""
+        record_id = await history.add_record(
+            source_path=movie_source,
+            destination_path=movie_dest,
+            status=IngestStatus.SUCCESS
+        )
+
+        record = await history.get_record(record_id)
+        assert isinstance(record_id, int)
+        assert record.id == record_id
+        assert record.source_path == movie_source
+        assert record.destination_path == movie_dest
+        assert await history.is_duplicate(source_path=movie_source) is True
 
     @pytest.mark.asyncio
-    async def test_add_record_with_metadata(self, temp_dir, temp_ingest_dir, temp_media_root):
-        """Should store additional metadata as JSON."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
+    async def test_add_records_bulk(self, history, temp_ingest_dir, temp_media_root):
+        """Should insert many records in one transaction."""
+        records = [
+            {
+                "source_path": temp_ingest_dir / f"movie{i}.mkv",
+                "destination_path": temp_media_root / "Movies" / f"Movie{i}.mkv",
+                "status": IngestStatus.SUCCESS,
+                "tmdb_id": 1000 + i,
+                "metadata": {"index": i},
+            }
+            for i in range(5)
+        ]
+
+        inserted = await history.add_records_bulk(records)
+
+        assert inserted == 5
+        all_records = await history.get_all_records()
+        assert len(all_records) == 5
+        assert {r.tmdb_id for r in all_records} == {1000, 1001, 1002, 1003, 1004}
+        assert await history.add_records_bulk([]) == 0
 
-        source = temp_ingest_dir / "movie.mkv"
-        dest = temp_media_root / "Movies" / "Movie.mkv"
-        metadata = {
-            "title": "Inception",
-            "year": 2010,
-            "resolution": "1080p"
-        }
 
+    @pytest.mark.asyncio
+    async def test_metadata_stored_as_blob(self, history, movie_source, movie_dest):
+        """Should store metadata as JSON bytes and still read legacy JSON text."""
+        metadata = {"title": "Inception", "year": 2010}
         record_id = await history.add_record(
-            source_path=source,
-            destination_path=dest,
+            source_path=movie_source,
+            destination_path=movie_dest,
             status=IngestStatus.SUCCESS,
             metadata=metadata
         )
+        legacy_id = await history.add_record(
+            source_path=movie_source,
+            destination_path=movie_dest,
+            status=IngestStatus.SUCCESS
+        )
+        await history._db.execute(
+            "UPDATE ingest_records SET metadata = ? WHERE id = ?",
+            ('{"title": "Legacy"}', legacy_id)
+        )
+        await history._db.commit()
 
-        record = await history.get_record(record_id)
-        assert record.metadata == metadata
-
-        await history.close()
+        cursor = await history._db.execute(
+            "SELECT typeof(metadata) FROM ingest_records WHERE id = ?", (record_id,)
+        )
+        assert (await cursor.fetchone())[0] == "blob"
+        assert (await history.get_record(record_id)).metadata == metadata
+        assert (await history.get_record(legacy_id)).metadata == {"title": "Legacy"}
 
 
 class TestGetRecord:
     """Test retrieving individual records."""
 
     @pytest.mark.asyncio
-    async def test_get_existing_record(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_get_existing_record(self, history, temp_ingest_dir, temp_media_root):
         """Should retrieve existing record by ID."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         source = temp_ingest_dir / "movie.mkv"
         dest = temp_media_root / "Movies" / "Movie.mkv"
 
@@ -166,32 +234,20 @@ class TestGetRecord:
         assert record.status == IngestStatus.SUCCESS
         assert isinstance(record.timestamp, datetime)
 
-        await history.close()
-
     @pytest.mark.asyncio
-    async def test_get_nonexistent_record(self, temp_dir):
+    async def test_get_nonexistent_record(self, history):
         """Should return None for nonexistent record."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         record = await history.get_record(99999)
 
         assert record is None
 
-        await history.close()
-
 
 class TestUpdateRecord:
     """Test updating existing records."""
 
     @pytest.mark.asyncio
-    async def test_update_record_status(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_update_record_status(self, history, temp_ingest_dir, temp_media_root):
         """Should update record status."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         source = temp_ingest_dir / "movie.mkv"
         dest = temp_media_root / "Movies" / "Movie.mkv"
 
@@ -206,15 +262,9 @@ class TestUpdateRecord:
         record = await history.get_record(record_id)
         assert record.status == IngestStatus.SUCCESS
 
-        await history.close()
-
     @pytest.mark.asyncio
-    async def test_update_record_multiple_fields(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_update_record_multiple_fields(self, history, temp_ingest_dir, temp_media_root):
         """Should update multiple fields at once."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         source = temp_ingest_dir / "movie.mkv"
         dest = temp_media_root / "Movies" / "Movie.mkv"
 
@@ -236,99 +286,69 @@ class TestUpdateRecord:
         assert record.tmdb_id == 12345
         assert record.confidence == 0.92
 
-        await history.close()
-
 
 class TestQueryRecords:
     """Test querying records with filters."""
 
     @pytest.mark.asyncio
-    async def test_get_all_records(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_get_all_records(self, history, temp_ingest_dir, temp_media_root):
         """Should retrieve all records."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         # Add multiple records
-        for i in range(3):
-            await history.add_record(
-                source_path=temp_ingest_dir / f"movie{i}.mkv",
-                destination_path=temp_media_root / f"movie{i}.mkv",
-                status=IngestStatus.SUCCESS
-            )
+        await history.add_records_bulk([
+            {
+                "source_path": temp_ingest_dir / f"movie{i}.mkv",
+                "destination_path": temp_media_root / f"movie{i}.mkv",
+                "status": IngestStatus.SUCCESS,
+            }
+            for i in range(3)
+        ])
 
         records = await history.get_all_records()
 
         assert len(records) == 3
 
-        await history.close()
-
     @pytest.mark.asyncio
-    async def test_query_by_status(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_query_by_status(self, history, temp_ingest_dir, temp_media_root):
         """Should filter records by status."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         # Add records with different statuses
-        await history.add_record(
-            source_path=temp_ingest_dir / "movie1.mkv",
-            destination_path=temp_media_root / "movie1.mkv",
-            status=IngestStatus.SUCCESS
-        )
-        await history.add_record(
-            source_path=temp_ingest_dir / "movie2.mkv",
-            destination_path=temp_media_root / "movie2.mkv",
-            status=IngestStatus.FAILED
-        )
-        await history.add_record(
-            source_path=temp_ingest_dir / "movie3.mkv",
-            destination_path=temp_media_root / "movie3.mkv",
-            status=IngestStatus.SUCCESS
-        )
+        await history.add_records_bulk([
+            {
+                "source_path": temp_ingest_dir / f"movie{i}.mkv",
+                "destination_path": temp_media_root / f"movie{i}.mkv",
+                "status": status,
+            }
+            for i, status in enumerate(
+                [IngestStatus.SUCCESS, IngestStatus.FAILED, IngestStatus.SUCCESS], 1
+            )
+        ])
 
         success_records = await history.query_records(status=IngestStatus.SUCCESS)
 
         assert len(success_records) == 2
         assert all(r.status == IngestStatus.SUCCESS for r in success_records)
 
-        await history.close()
-
     @pytest.mark.asyncio
-    async def test_query_by_tmdb_id(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_query_by_tmdb_id(self, history, temp_ingest_dir, temp_media_root):
         """Should filter records by TMDb ID."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         # Add records with different TMDb IDs
-        await history.add_record(
-            source_path=temp_ingest_dir / "movie1.mkv",
-            destination_path=temp_media_root / "movie1.mkv",
-            tmdb_id=12345,
-            status=IngestStatus.SUCCESS
-        )
-        await history.add_record(
-            source_path=temp_ingest_dir / "movie2.mkv",
-            destination_path=temp_media_root / "movie2.mkv",
-            tmdb_id=67890,
-            status=IngestStatus.SUCCESS
-        )
+        await history.add_records_bulk([
+            {
+                "source_path": temp_ingest_dir / f"movie{i}.mkv",
+                "destination_path": temp_media_root / f"movie{i}.mkv",
+                "tmdb_id": tmdb_id,
+                "status": IngestStatus.SUCCESS,
+            }
+            for i, tmdb_id in enumerate([12345, 67890], 1)
+        ])
 
         records = await history.query_records(tmdb_id=12345)
 
         assert len(records) == 1
         assert records[0].tmdb_id == 12345
 
-        await history.close()
-
     @pytest.mark.asyncio
-    async def test_query_by_date_range(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_query_by_date_range(self, history, temp_ingest_dir, temp_media_root):
         """Should filter records by date range."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         # Add record
         record_id = await history.add_record(
             source_path=temp_ingest_dir / "movie.mkv",
@@ -349,46 +369,52 @@ class TestQueryRecords:
         assert len(records) == 1
         assert records[0].id == record_id
 
-        await history.close()
-
     @pytest.mark.asyncio
-    async def test_query_by_media_type(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_query_by_media_type(self, history, temp_ingest_dir, temp_media_root):
         """Should filter records by media type."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
-        await history.add_record(
-            source_path=temp_ingest_dir / "movie.mkv",
-            destination_path=temp_media_root / "movie.mkv",
-            media_type="movie",
-            status=IngestStatus.SUCCESS
-        )
-        await history.add_record(
-            source_path=temp_ingest_dir / "episode.mkv",
-            destination_path=temp_media_root / "episode.mkv",
-            media_type="tv",
-            status=IngestStatus.SUCCESS
-        )
+        await history.add_records_bulk([
+            {
+                "source_path": temp_ingest_dir / f"{name}.mkv",
+                "destination_path": temp_media_root / f"{name}.mkv",
+                "media_type": media_type,
+                "status": IngestStatus.SUCCESS,
+            }
+            for name, media_type in [("movie", "movie"), ("episode", "tv")]
+        ])
 
         movie_records = await history.query_records(media_type="movie")
 
         assert len(movie_records) == 1
         assert movie_records[0].media_type == "movie"
 
-        await history.close()
+    @pytest.mark.asyncio
+    async def test_query_orders_timestamp_ties_newest_first(self, history, temp_ingest_dir, temp_media_root):
+        """Should break timestamp ties by id, like get_all_records."""
+        await history.add_records_bulk([
+            {
+                "source_path": temp_ingest_dir / f"movie{i}.mkv",
+                "destination_path": temp_media_root / f"movie{i}.mkv",
+                "status": IngestStatus.SUCCESS,
+            }
+            for i in range(3)
+        ])
+        await history._db.execute(
+            "UPDATE ingest_records SET timestamp = ?", (datetime.now().isoformat(),)
+        )
+        await history._db.commit()
+
+        records = await history.query_records(status=IngestStatus.SUCCESS)
+
+        assert [r.id for r in records] == [r.id for r in await history.get_all_records()]
+        assert [r.id for r in records] == sorted((r.id for r in records), reverse=True)
 
 
 class TestDuplicateDetection:
     """Test duplicate detection functionality."""
 
     @pytest.mark.asyncio
-    async def test_find_duplicate_by_tmdb_id(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_find_duplicate_by_tmdb_id(self, history, temp_ingest_dir, temp_media_root):
         """Should detect duplicates by TMDb ID."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         # Add record with TMDb ID
         await history.add_record(
             source_path=temp_ingest_dir / "movie1.mkv",
@@ -402,15 +428,9 @@ class TestDuplicateDetection:
 
         assert is_duplicate is True
 
-        await history.close()
-
     @pytest.mark.asyncio
-    async def test_find_duplicate_by_source_path(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_find_duplicate_by_source_path(self, history, temp_ingest_dir, temp_media_root):
         """Should detect duplicates by source path."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         source = temp_ingest_dir / "movie.mkv"
 
         # Add record
@@ -425,28 +445,16 @@ class TestDuplicateDetection:
 
         assert is_duplicate is True
 
-        await history.close()
-
     @pytest.mark.asyncio
-    async def test_no_duplicate_found(self, temp_dir):
+    async def test_no_duplicate_found(self, history):
         """Should return False when no duplicate exists."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         is_duplicate = await history.is_duplicate(tmdb_id=99999)
 
         assert is_duplicate is False
 
-        await history.close()
-
     @pytest.mark.asyncio
-    async def test_ignore_failed_status_in_duplicate_check(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_ignore_failed_status_in_duplicate_check(self, history, temp_ingest_dir, temp_media_root):
         """Should not count failed ingests as duplicates."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         # Add failed record
         await history.add_record(
             source_path=temp_ingest_dir / "movie.mkv",
@@ -460,26 +468,81 @@ class TestDuplicateDetection:
 
         assert is_duplicate is False
 
-        await history.close()
+    @pytest.mark.asyncio
+    async def test_duplicate_cleared_when_record_fails(self, history, temp_ingest_dir, temp_media_root):
+        """Should stop reporting a duplicate once its only record is marked FAILED."""
+        source = temp_ingest_dir / "movie.mkv"
+        record_id = await history.add_record(
+            source_path=source,
+            destination_path=temp_media_root / "movie.mkv",
+            tmdb_id=12345,
+            status=IngestStatus.PENDING
+        )
+
+        assert await history.is_duplicate(tmdb_id=12345) is True
+        assert await history.is_duplicate(tmdb_id=12345, source_path=source) is True
+
+        await history.update_record(record_id, status=IngestStatus.FAILED)
+
+        assert await history.is_duplicate(tmdb_id=12345) is False
+        assert await history.is_duplicate(tmdb_id=12345, source_path=source) is False
+
+    async def test_duplicate_not_recached_during_failed_update(self, temp_dir, movie_source, movie_dest):
+        """Should not re-cache a duplicate read by a reader before the FAILED update commits."""
+        async with IngestHistory(temp_dir / "history.db", reader_count=2) as history:
+            record_id = await history.add_record(
+                source_path=movie_source,
+                destination_path=movie_dest,
+                tmdb_id=12345,
+                status=IngestStatus.PENDING
+            )
+            real_commit = history._db.commit
+            seen_before_commit = []
+
+            async def commit_after_lookup():
+                # A concurrent lookup between the UPDATE and its commit
+                seen_before_commit.append(await history.is_duplicate(tmdb_id=12345))
+                await real_commit()
+
+            history._db.commit = commit_after_lookup
+            await history.update_record(record_id, status=IngestStatus.FAILED)
+            history._db.commit = real_commit
+
+            assert seen_before_commit == [True]
+            assert await history.is_duplicate(tmdb_id=12345) is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("column,index", [
+        ("tmdb_id", "idx_dup"),
+        ("source_path", "idx_source_status"),
+    ])
+    async def test_duplicate_check_uses_covering_index(self, history, column, index):
+        """Should answer duplicate lookups from an index without touching the table."""
+        cursor = await history._db.execute(
+            f"EXPLAIN QUERY PLAN SELECT 1 FROM ingest_records "
+            f"WHERE {column} = ? AND status != ? LIMIT 1",
+            (1, "failed")
+        )
+        plan = " ".join(row[-1] for row in await cursor.fetchall())
+
+        assert f"USING COVERING INDEX {index}" in plan
 
 
 class TestGetRecentRecords:
     """Test retrieving recent records."""
 
     @pytest.mark.asyncio
-    async def test_get_recent_records_with_limit(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_get_recent_records_with_limit(self, history, temp_ingest_dir, temp_media_root):
         """Should retrieve most recent records up to limit."""
-        db_path = temp_dir / "ingest_history.db"
-        history = IngestHistory(db_path)
-        await history.initialize()
-
         # Add multiple records
-        for i in range(5):
-            await history.add_record(
-                source_path=temp_ingest_dir / f"movie{i}.mkv",
-                destination_path=temp_media_root / f"movie{i}.mkv",
-                status=IngestStatus.SUCCESS
-            )
+        await history.add_records_bulk([
+            {
+                "source_path": temp_ingest_dir / f"movie{i}.mkv",
+                "destination_path": temp_media_root / f"movie{i}.mkv",
+                "status": IngestStatus.SUCCESS,
+            }
+            for i in range(5)
+        ])
 
         recent = await history.get_recent_records(limit=3)
 
@@ -487,41 +550,78 @@ class TestGetRecentRecords:
         # Should be in reverse chronological order
         assert recent[0].id > recent[1].id > recent[2].id
 
-        await history.close()
-
 
 class TestStatistics:
     """Test ingest statistics."""
 
     @pytest.mark.asyncio
-    async def test_get_statistics(self, temp_dir, temp_ingest_dir, temp_media_root):
+    async def test_get_statistics(self, history, temp_ingest_dir, temp_media_root):
         """Should calculate statistics for ingest operations."""
+        # Add various records
+        await history.add_records_bulk([
+            {
+                "source_path": temp_ingest_dir / f"movie{i}.mkv",
+                "destination_path": temp_media_root / f"movie{i}.mkv",
+                "status": status,
+            }
+            for i, status in enumerate(
+                [IngestStatus.SUCCESS, IngestStatus.SUCCESS, IngestStatus.FAILED], 1
+            )
+        ])
+
+        stats = await history.get_statistics()
+
+        assert stats["total"] == 3
+        assert stats["success"] == 2
+        assert stats["failed"] == 1
+        assert stats["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_statistics_follow_status_updates(self, temp_dir, temp_ingest_dir, temp_media_root):
+        """Should keep per-status counts in step with update_record and reopen."""
         db_path = temp_dir / "ingest_history.db"
         history = IngestHistory(db_path)
         await history.initialize()
 
-        # Add various records
-        await history.add_record(
+        record_id = await history.add_record(
             source_path=temp_ingest_dir / "movie1.mkv",
             destination_path=temp_media_root / "movie1.mkv",
-            status=IngestStatus.SUCCESS
-        )
-        await history.add_record(
-            source_path=temp_ingest_dir / "movie2.mkv",
-            destination_path=temp_media_root / "movie2.mkv",
-            status=IngestStatus.SUCCESS
-        )
-        await history.add_record(
-            source_path=temp_ingest_dir / "movie3.mkv",
-            destination_path=temp_media_root / "movie3.mkv",
-            status=IngestStatus.FAILED
+            status=IngestStatus.PENDING
         )
+        await history.update_record(record_id, status=IngestStatus.SUCCESS)
 
         stats = await history.get_statistics()
-
-        assert stats["total"] == 3
-        assert stats["success"] == 2
-        assert stats["failed"] == 1
-        assert stats["pending"] == 0
+        assert stats == {"total": 1, "success": 1, "failed": 0, "pending": 0}
 
         await history.close()
+
+        reopened = IngestHistory(db_path)
+        await reopened.initialize()
+        assert await reopened.get_statistics() == stats
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_statistics_rebuilt_only_when_schema_is_new(self, temp_dir, temp_ingest_dir, temp_media_root):
+        """Should skip the counter rebuild on reopen unless a trigger was missing."""
+        db_path = temp_dir / "ingest_history.db"
+        async with IngestHistory(db_path) as history:
+            await history.add_record(
+                source_path=temp_ingest_dir / "movie1.mkv",
+                destination_path=temp_media_root / "movie1.mkv",
+                status=IngestStatus.SUCCESS
+            )
+
+        # Skew the counter directly: a rebuild on open would undo this
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute("UPDATE ingest_stats SET count = 5 WHERE status = 'success'")
+            await db.commit()
+
+        async with IngestHistory(db_path) as reopened:
+            assert (await reopened.get_statistics())["success"] == 5
+
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute("DROP TRIGGER trg_stats_delete")
+            await db.commit()
+
+        async with IngestHistory(db_path) as rebuilt:
+            assert (await rebuilt.get_statistics())["success"] == 1
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from server.matcher import MediaMatcher
+from server.tmdb_cache import TMDbCache
 
 
 @pytest.mark.asyncio
@@ -36,6 +37,37 @@ class TestMediaMatcher:
             assert result["episode"] == 1
             assert result["type"] == "episode"
 
+    async def test_parse_filename_keeps_match_fields(self, mock_guessit_movie):
+        """Test parsed metadata is limited to the fields matching uses."""
+        matcher = MediaMatcher(tmdb_api_key="test-key")
+
+        with patch("guessit.guessit") as mock_guessit:
+            mock_guessit.return_value = {
+                **mock_guessit_movie,
+                "container": "mkv",
+                "mimetype": "video/x-matroska",
+            }
+
+            result = await matcher.parse_filename("Inception.2010.1080p.BluRay.x264.mkv")
+
+            assert result["title"] == "Inception"
+            assert "container" not in result
+            assert "mimetype" not in result
+
+    async def test_parse_filename_reuses_guessit_result(self, mock_guessit_movie):
+        """Test repeated filenames are parsed by guessit only once."""
+        matcher = MediaMatcher(tmdb_api_key="test-key")
+
+        with patch("guessit.guessit") as mock_guessit:
+            mock_guessit.return_value = mock_guessit_movie
+
+            first = await matcher.parse_filename("Inception.2010.mkv")
+            first["title"] = "Changed"
+            second = await matcher.parse_filename("Inception.2010.mkv")
+
+            assert mock_guessit.call_count == 1
+            assert second["title"] == "Inception"
+
     async def test_search_tmdb_movie(self, mock_tmdb_movie_result):
         """Test searching TMDb for a movie."""
         cache = AsyncMock()
@@ -270,6 +302,7 @@ class TestMediaMatcher:
         """Test batch matching multiple files."""
         cache = AsyncMock()
         cache.get.return_value = None
+        cache.get_many.return_value = {}
         cache.store = AsyncMock()
 
         matcher = MediaMatcher(tmdb_api_key="test-key", cache=cache, media_root="/data/media")
@@ -291,6 +324,46 @@ class TestMediaMatcher:
             assert len(results) == 2
             assert all(r is not None for r in results)
 
+    async def test_batch_match_uses_cache_multi_get(self, mock_guessit_movie, mock_tmdb_movie_result):
+        """Test batch matching fetches cached results in one call and skips TMDb."""
+        cache = AsyncMock()
+        cache.get_many.return_value = {
+            ("Inception", 2010, "movie"): [mock_tmdb_movie_result]
+        }
+
+        matcher = MediaMatcher(tmdb_api_key="test-key", cache=cache, media_root="/data/media")
+
+        with patch("guessit.guessit") as mock_guessit, \
+             patch("tmdbsimple.Search") as mock_search_class:
+            mock_guessit.return_value = mock_guessit_movie
+
+            results = await matcher.batch_match(["Inception.2010.mkv", "Inception.2010.720p.mkv"])
+
+            assert [r["tmdb_id"] for r in results] == [27205, 27205]
+            cache.get_many.assert_awaited_once()
+            cache.get.assert_not_called()
+            mock_search_class.assert_not_called()
+
+    async def test_batch_match_survives_list_valued_parse(self, temp_dir, mock_tmdb_movie_result):
+        """Test a name guessit parses with two years doesn't fail the whole batch."""
+        cache = TMDbCache(temp_dir / "tmdb_cache.db")
+        await cache.initialize()
+        matcher = MediaMatcher(tmdb_api_key="test-key", cache=cache, media_root="/data/media")
+
+        with patch("tmdbsimple.Search") as mock_search_class:
+            mock_search = MagicMock()
+            mock_search.movie.return_value = {"results": [mock_tmdb_movie_result]}
+            mock_search_class.return_value = mock_search
+
+            results = await matcher.batch_match([
+                "Inception.2010.1080p.mkv",
+                "Some Movie (1999) (2001).mkv",
+            ])
+
+        assert len(results) == 2
+        assert results[0]["tmdb_id"] == 27205
+        await cache.close()
+
     async def test_sanitize_filename(self):
         """Test filename sanitization for filesystem safety."""
         matcher = MediaMatcher(tmdb_api_key="test-key")
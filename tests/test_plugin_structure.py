@@ -5,13 +5,200 @@ Validates that the Claude Code plugin has all required files,
 proper structure, and valid manifest files.
 """
 
-import json
+import ast
+import importlib.machinery
+import os
+import re
 import pytest
 from pathlib import Path
+from typing import NamedTuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as _json_loads
 
 
 # Plugin root directory
 PLUGIN_ROOT = Path(__file__).parent.parent / "plex-plugin"
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# String paths for the per-file joins, so each doc read is a plain
+# os.path.join rather than a chain of Path objects
+COMMANDS_DIR = os.path.join(PLUGIN_ROOT, "commands")
+AGENTS_DIR = os.path.join(PLUGIN_ROOT, "agents")
+HOOKS_DIR = os.path.join(PLUGIN_ROOT, "hooks")
+SAFETY_HOOK_FILE = os.path.join(HOOKS_DIR, "safety.py")
+
+REQUIRED_COMMANDS = [
+    "scan",
+    "identify",
+    "rename",
+    "ingest",
+    "status",
+    "plan",
+    "watch",
+    "review",
+]
+
+REQUIRED_AGENTS = ["library", "media", "ingest", "watcher"]
+
+REQUIRED_PLUGIN_FIELDS = frozenset({
+    "plugin_version",
+    "plugin_format",
+    "name",
+    "display_name",
+    "description",
+    "author",
+    "license",
+    "mcp_server",
+    "commands",
+    "agents",
+})
+
+REQUIRED_MCP_ENV_VARS = frozenset({
+    "PLEX_URL",
+    "PLEX_TOKEN",
+    "TMDB_API_KEY",
+    "PLEX_MEDIA_ROOT",
+})
+
+REQUIRED_ROOT_MANIFEST_FIELDS = frozenset({
+    "manifest_version",
+    "name",
+    "display_name",
+    "description",
+    "version",
+    "author",
+    "server",
+})
+
+# Any one of these terms satisfies the check; one case-insensitive search
+# per document instead of one substring scan per term
+SAFETY_TERMS_RE = re.compile(r"safety|read-only|write operation|confirmation", re.I)
+TOOL_TERMS_RE = re.compile(r"tool|mcp|function|operation", re.I)
+
+# Every /plex:<command> mention in one pass over a document
+COMMAND_MENTION_RE = re.compile(rf"/plex:({'|'.join(REQUIRED_COMMANDS)})\b")
+
+
+class DocText(NamedTuple):
+    """A markdown document's raw bytes, decoded text and lowercased text."""
+    raw: bytes
+    text: str
+    lower: str
+
+
+def _read_docs(directory: str, names) -> dict:
+    """Read <name>.md from directory for each name."""
+    docs = {}
+    for name in names:
+        with open(os.path.join(directory, f"{name}.md"), "rb") as f:
+            raw = f.read()
+        text = raw.decode("utf-8")
+        docs[name] = DocText(raw, text, text.lower())
+    return docs
+
+
+def _scan(directory: str | Path) -> dict:
+    """Map entry names to os.DirEntry for one directory (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except FileNotFoundError:
+        return {}
+
+
+# Directory listings are taken once per session, so existence checks are
+# dict lookups instead of a stat() per file
+
+@pytest.fixture(scope="session")
+def plugin_tree():
+    """Entries in the plugin root directory."""
+    return _scan(PLUGIN_ROOT)
+
+
+@pytest.fixture(scope="session")
+def commands_tree():
+    """Entries in the plugin's commands directory."""
+    return _scan(COMMANDS_DIR)
+
+
+@pytest.fixture(scope="session")
+def agents_tree():
+    """Entries in the plugin's agents directory."""
+    return _scan(AGENTS_DIR)
+
+
+@pytest.fixture(scope="session")
+def hooks_tree():
+    """Entries in the plugin's hooks directory."""
+    return _scan(HOOKS_DIR)
+
+
+# Each manifest is read and parsed once per session and shared by every
+# test that inspects it; the *_exists tests still check presence directly.
+
+@pytest.fixture(scope="session")
+def plugin_manifest():
+    """Parsed plugin.json."""
+    return _json_loads((PLUGIN_ROOT / "plugin.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def mcp_manifest():
+    """Parsed .mcp.json."""
+    return _json_loads((PLUGIN_ROOT / ".mcp.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def root_manifest():
+    """Parsed project root manifest.json."""
+    return _json_loads((PROJECT_ROOT / "manifest.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def safety_ast():
+    """hooks/safety.py parsed once; structural checks walk this tree."""
+    with open(SAFETY_HOOK_FILE, "rb") as f:
+        source = f.read()
+    try:
+        return ast.parse(source, filename=SAFETY_HOOK_FILE)
+    except SyntaxError as e:
+        pytest.fail(f"safety.py has syntax error: {e}")
+
+
+def _defined_names(body) -> dict:
+    """Map names bound by def/class/assignment statements in body to their node."""
+    names = {}
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names[node.name] = node
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    names[target.id] = node
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names[node.target.id] = node
+    return names
+
+
+@pytest.fixture(scope="session")
+def command_texts():
+    """Command docs by command name, each read once per session."""
+    return _read_docs(COMMANDS_DIR, REQUIRED_COMMANDS)
+
+
+@pytest.fixture(scope="session")
+def agent_texts():
+    """Agent docs by agent name, each read once per session."""
+    return _read_docs(AGENTS_DIR, REQUIRED_AGENTS)
+
+
+@pytest.fixture(scope="session")
+def skill_md_text():
+    """Contents of SKILL.md."""
+    return (PLUGIN_ROOT / "SKILL.md").read_text()
 
 
 class TestPluginStructure:
@@ -22,235 +209,142 @@ class TestPluginStructure:
         assert PLUGIN_ROOT.exists()
         assert PLUGIN_ROOT.is_dir()
 
-    def test_commands_directory_exists(self):
-        """Commands directory should exist."""
-        commands_dir = PLUGIN_ROOT / "commands"
-        assert commands_dir.exists()
-        assert commands_dir.is_dir()
-
-    def test_agents_directory_exists(self):
-        """Agents directory should exist."""
-        agents_dir = PLUGIN_ROOT / "agents"
-        assert agents_dir.exists()
-        assert agents_dir.is_dir()
-
-    def test_hooks_directory_exists(self):
-        """Hooks directory should exist."""
-        hooks_dir = PLUGIN_ROOT / "hooks"
-        assert hooks_dir.exists()
-        assert hooks_dir.is_dir()
+    @pytest.mark.parametrize("subdir", ["commands", "agents", "hooks"])
+    def test_plugin_subdirectory_exists(self, subdir, plugin_tree):
+        """Commands, agents and hooks directories should exist."""
+        assert subdir in plugin_tree, f"{subdir}/ directory missing"
+        assert plugin_tree[subdir].is_dir()
 
 
 class TestCommandFiles:
     """Test command documentation files."""
 
-    REQUIRED_COMMANDS = [
-        "scan",
-        "identify",
-        "rename",
-        "ingest",
-        "status",
-        "plan",
-        "watch",
-        "review",
-    ]
-
-    def test_all_command_files_exist(self):
-        """All 8 command files should exist."""
-        commands_dir = PLUGIN_ROOT / "commands"
-
-        for cmd in self.REQUIRED_COMMANDS:
-            cmd_file = commands_dir / f"{cmd}.md"
-            assert cmd_file.exists(), f"Missing command file: {cmd}.md"
-
-    def test_command_files_not_empty(self):
-        """Command files should not be empty."""
-        commands_dir = PLUGIN_ROOT / "commands"
+    @pytest.mark.parametrize("cmd", REQUIRED_COMMANDS)
+    def test_command_file_exists(self, cmd, commands_tree):
+        """Each of the 8 command files should exist."""
+        assert f"{cmd}.md" in commands_tree, f"Missing command file: {cmd}.md"
 
-        for cmd in self.REQUIRED_COMMANDS:
-            cmd_file = commands_dir / f"{cmd}.md"
-            content = cmd_file.read_text()
-            assert len(content) > 100, f"{cmd}.md is too short"
+    @pytest.mark.parametrize("cmd", REQUIRED_COMMANDS)
+    def test_command_file_not_empty(self, cmd, commands_tree):
+        """Command files should not be empty."""
+        assert commands_tree[f"{cmd}.md"].stat().st_size > 100, f"{cmd}.md is too short"
 
-    def test_command_files_have_headers(self):
+    @pytest.mark.parametrize("cmd", REQUIRED_COMMANDS)
+    def test_command_file_has_header(self, cmd, command_texts):
         """Command files should have proper markdown headers."""
-        commands_dir = PLUGIN_ROOT / "commands"
-
-        for cmd in self.REQUIRED_COMMANDS:
-            cmd_file = commands_dir / f"{cmd}.md"
-            content = cmd_file.read_text()
-            assert content.startswith("#"), f"{cmd}.md missing header"
-            assert cmd in content.lower(), f"{cmd}.md doesn't mention command name"
+        doc = command_texts[cmd]
+        assert doc.raw[:1] == b"#", f"{cmd}.md missing header"
+        assert cmd in doc.lower, f"{cmd}.md doesn't mention command name"
 
-    def test_command_files_have_usage_section(self):
+    @pytest.mark.parametrize("cmd", REQUIRED_COMMANDS)
+    def test_command_file_has_usage_section(self, cmd, command_texts):
         """Command files should have Usage section."""
-        commands_dir = PLUGIN_ROOT / "commands"
-
-        for cmd in self.REQUIRED_COMMANDS:
-            cmd_file = commands_dir / f"{cmd}.md"
-            content = cmd_file.read_text()
-            assert "## Usage" in content or "## usage" in content.lower(), \
-                f"{cmd}.md missing Usage section"
+        doc = command_texts[cmd]
+        assert "## Usage" in doc.text or "## usage" in doc.lower, \
+            f"{cmd}.md missing Usage section"
 
-    def test_command_files_have_safety_section(self):
+    @pytest.mark.parametrize("cmd", REQUIRED_COMMANDS)
+    def test_command_file_has_safety_section(self, cmd, command_texts):
         """Command files should document safety classification."""
-        commands_dir = PLUGIN_ROOT / "commands"
-
-        for cmd in self.REQUIRED_COMMANDS:
-            cmd_file = commands_dir / f"{cmd}.md"
-            content = cmd_file.read_text()
-            # Should mention safety classification
-            has_safety = any(term in content.lower() for term in [
-                "safety", "read-only", "write operation", "confirmation"
-            ])
-            assert has_safety, f"{cmd}.md missing safety documentation"
+        # Should mention safety classification
+        assert SAFETY_TERMS_RE.search(command_texts[cmd].text), \
+            f"{cmd}.md missing safety documentation"
 
 
 class TestAgentFiles:
     """Test agent documentation files."""
 
-    REQUIRED_AGENTS = ["library", "media", "ingest", "watcher"]
-
-    def test_all_agent_files_exist(self):
-        """All 4 agent files should exist."""
-        agents_dir = PLUGIN_ROOT / "agents"
-
-        for agent in self.REQUIRED_AGENTS:
-            agent_file = agents_dir / f"{agent}.md"
-            assert agent_file.exists(), f"Missing agent file: {agent}.md"
+    @pytest.mark.parametrize("agent", REQUIRED_AGENTS)
+    def test_agent_file_exists(self, agent, agents_tree):
+        """Each of the 4 agent files should exist."""
+        assert f"{agent}.md" in agents_tree, f"Missing agent file: {agent}.md"
 
-    def test_agent_files_not_empty(self):
+    @pytest.mark.parametrize("agent", REQUIRED_AGENTS)
+    def test_agent_file_not_empty(self, agent, agents_tree):
         """Agent files should not be empty."""
-        agents_dir = PLUGIN_ROOT / "agents"
+        assert agents_tree[f"{agent}.md"].stat().st_size > 500, f"{agent}.md is too short"
 
-        for agent in self.REQUIRED_AGENTS:
-            agent_file = agents_dir / f"{agent}.md"
-            content = agent_file.read_text()
-            assert len(content) > 500, f"{agent}.md is too short"
-
-    def test_agent_files_have_role_section(self):
+    @pytest.mark.parametrize("agent", REQUIRED_AGENTS)
+    def test_agent_file_has_role_section(self, agent, agent_texts):
         """Agent files should define role."""
-        agents_dir = PLUGIN_ROOT / "agents"
-
-        for agent in self.REQUIRED_AGENTS:
-            agent_file = agents_dir / f"{agent}.md"
-            content = agent_file.read_text()
-            assert "## Role" in content or "role" in content.lower(), \
-                f"{agent}.md missing Role section"
+        doc = agent_texts[agent]
+        assert "## Role" in doc.text or "role" in doc.lower, \
+            f"{agent}.md missing Role section"
 
-    def test_agent_files_have_capabilities_section(self):
+    @pytest.mark.parametrize("agent", REQUIRED_AGENTS)
+    def test_agent_file_has_capabilities_section(self, agent, agent_texts):
         """Agent files should describe capabilities."""
-        agents_dir = PLUGIN_ROOT / "agents"
-
-        for agent in self.REQUIRED_AGENTS:
-            agent_file = agents_dir / f"{agent}.md"
-            content = agent_file.read_text()
-            assert "## Capabilities" in content or "capabilit" in content.lower(), \
-                f"{agent}.md missing Capabilities section"
+        doc = agent_texts[agent]
+        assert "## Capabilities" in doc.text or "capabilit" in doc.lower, \
+            f"{agent}.md missing Capabilities section"
 
-    def test_agent_files_reference_tools(self):
+    @pytest.mark.parametrize("agent", REQUIRED_AGENTS)
+    def test_agent_file_references_tools(self, agent, agent_texts):
         """Agent files should mention MCP tools."""
-        agents_dir = PLUGIN_ROOT / "agents"
-
-        for agent in self.REQUIRED_AGENTS:
-            agent_file = agents_dir / f"{agent}.md"
-            content = agent_file.read_text()
-            # Should reference tools or MCP
-            has_tool_refs = any(term in content.lower() for term in [
-                "tool", "mcp", "function", "operation"
-            ])
-            assert has_tool_refs, f"{agent}.md doesn't reference tools"
+        # Should reference tools or MCP
+        assert TOOL_TERMS_RE.search(agent_texts[agent].text), \
+            f"{agent}.md doesn't reference tools"
 
 
 class TestHookFiles:
     """Test hook implementation files."""
 
-    def test_safety_hook_exists(self):
+    def test_safety_hook_exists(self, hooks_tree):
         """Safety hook file should exist."""
-        hook_file = PLUGIN_ROOT / "hooks" / "safety.py"
-        assert hook_file.exists()
+        assert "safety.py" in hooks_tree
 
     def test_safety_hook_is_valid_python(self):
         """Safety hook should be valid Python."""
-        hook_file = PLUGIN_ROOT / "hooks" / "safety.py"
-        content = hook_file.read_text()
-
-        # Basic syntax check
+        # get_code() reuses __pycache__ bytecode while safety.py is unchanged
+        loader = importlib.machinery.SourceFileLoader("safety", SAFETY_HOOK_FILE)
         try:
-            compile(content, str(hook_file), "exec")
+            loader.get_code("safety")
         except SyntaxError as e:
             pytest.fail(f"safety.py has syntax error: {e}")
 
-    def test_safety_hook_has_main_function(self):
+    def test_safety_hook_has_main_function(self, safety_ast):
         """Safety hook should define safety_hook function."""
-        hook_file = PLUGIN_ROOT / "hooks" / "safety.py"
-        content = hook_file.read_text()
-
-        assert "def safety_hook(" in content, \
+        node = _defined_names(safety_ast.body).get("safety_hook")
+        assert isinstance(node, ast.FunctionDef), \
             "safety.py missing safety_hook function"
 
-    def test_safety_hook_has_safety_tiers(self):
+    def test_safety_hook_has_safety_tiers(self, safety_ast):
         """Safety hook should define SafetyTier enum."""
-        hook_file = PLUGIN_ROOT / "hooks" / "safety.py"
-        content = hook_file.read_text()
-
-        assert "SafetyTier" in content, \
+        node = _defined_names(safety_ast.body).get("SafetyTier")
+        assert isinstance(node, ast.ClassDef), \
             "safety.py missing SafetyTier definition"
-        assert "READ" in content
-        assert "WRITE" in content
-        assert "BLOCKED" in content
+        members = _defined_names(node.body)
+        assert "READ" in members
+        assert "WRITE" in members
+        assert "BLOCKED" in members
 
-    def test_safety_hook_has_tool_map(self):
+    def test_safety_hook_has_tool_map(self, safety_ast):
         """Safety hook should have tool classification map."""
-        hook_file = PLUGIN_ROOT / "hooks" / "safety.py"
-        content = hook_file.read_text()
-
-        assert "TOOL_SAFETY_MAP" in content or "tool_safety" in content.lower(), \
-            "safety.py missing tool classification map"
+        names = _defined_names(safety_ast.body)
+        assert "TOOL_SAFETY_MAP" in names or any(
+            "tool_safety" in name.lower() for name in names
+        ), "safety.py missing tool classification map"
 
 
 class TestManifestFiles:
     """Test manifest and configuration files."""
 
-    def test_plugin_json_exists(self):
+    def test_plugin_json_exists(self, plugin_tree):
         """plugin.json should exist."""
-        manifest = PLUGIN_ROOT / "plugin.json"
-        assert manifest.exists()
+        assert "plugin.json" in plugin_tree
 
-    def test_plugin_json_is_valid_json(self):
+    def test_plugin_json_is_valid_json(self, plugin_manifest):
         """plugin.json should be valid JSON."""
-        manifest = PLUGIN_ROOT / "plugin.json"
-        with open(manifest) as f:
-            data = json.load(f)
-        assert isinstance(data, dict)
+        assert isinstance(plugin_manifest, dict)
 
-    def test_plugin_json_has_required_fields(self):
+    def test_plugin_json_has_required_fields(self, plugin_manifest):
         """plugin.json should have all required fields."""
-        manifest = PLUGIN_ROOT / "plugin.json"
-        with open(manifest) as f:
-            data = json.load(f)
-
-        required_fields = [
-            "plugin_version",
-            "plugin_format",
-            "name",
-            "display_name",
-            "description",
-            "author",
-            "license",
-            "mcp_server",
-            "commands",
-            "agents",
-        ]
-
-        for field in required_fields:
-            assert field in data, f"plugin.json missing {field}"
-
-    def test_plugin_json_commands_structure(self):
+        missing = REQUIRED_PLUGIN_FIELDS - plugin_manifest.keys()
+        assert not missing, f"plugin.json missing {sorted(missing)}"
+
+    def test_plugin_json_commands_structure(self, plugin_manifest):
         """plugin.json commands should have proper structure."""
-        manifest = PLUGIN_ROOT / "plugin.json"
-        with open(manifest) as f:
-            data = json.load(f)
+        data = plugin_manifest
 
         assert "commands" in data
         assert isinstance(data["commands"], list)
@@ -263,11 +357,9 @@ class TestManifestFiles:
             assert "safety" in cmd
             assert cmd["safety"] in ["read", "write", "mixed"]
 
-    def test_plugin_json_agents_structure(self):
+    def test_plugin_json_agents_structure(self, plugin_manifest):
         """plugin.json agents should have proper structure."""
-        manifest = PLUGIN_ROOT / "plugin.json"
-        with open(manifest) as f:
-            data = json.load(f)
+        data = plugin_manifest
 
         assert "agents" in data
         assert isinstance(data["agents"], list)
@@ -278,34 +370,26 @@ class TestManifestFiles:
             assert "description" in agent
             assert "documentation" in agent
 
-    def test_plugin_json_hooks_structure(self):
+    def test_plugin_json_hooks_structure(self, plugin_manifest):
         """plugin.json should define safety hook."""
-        manifest = PLUGIN_ROOT / "plugin.json"
-        with open(manifest) as f:
-            data = json.load(f)
+        data = plugin_manifest
 
         assert "hooks" in data
         assert "safety" in data["hooks"]
         assert "handler" in data["hooks"]["safety"]
         assert "safety.py" in data["hooks"]["safety"]["handler"]
 
-    def test_mcp_json_exists(self):
+    def test_mcp_json_exists(self, plugin_tree):
         """.mcp.json should exist."""
-        mcp_config = PLUGIN_ROOT / ".mcp.json"
-        assert mcp_config.exists()
+        assert ".mcp.json" in plugin_tree
 
-    def test_mcp_json_is_valid_json(self):
+    def test_mcp_json_is_valid_json(self, mcp_manifest):
         """.mcp.json should be valid JSON."""
-        mcp_config = PLUGIN_ROOT / ".mcp.json"
-        with open(mcp_config) as f:
-            data = json.load(f)
-        assert isinstance(data, dict)
+        assert isinstance(mcp_manifest, dict)
 
-    def test_mcp_json_has_server_config(self):
+    def test_mcp_json_has_server_config(self, mcp_manifest):
         """.mcp.json should have MCP server configuration."""
-        mcp_config = PLUGIN_ROOT / ".mcp.json"
-        with open(mcp_config) as f:
-            data = json.load(f)
+        data = mcp_manifest
 
         assert "mcpServers" in data
         assert "plex-media-server" in data["mcpServers"]
@@ -315,101 +399,62 @@ class TestManifestFiles:
         assert "args" in server_config
         assert "env" in server_config
 
-    def test_mcp_json_env_has_required_vars(self):
+    def test_mcp_json_env_has_required_vars(self, mcp_manifest):
         """.mcp.json should define required environment variables."""
-        mcp_config = PLUGIN_ROOT / ".mcp.json"
-        with open(mcp_config) as f:
-            data = json.load(f)
-
-        env = data["mcpServers"]["plex-media-server"]["env"]
+        env = mcp_manifest["mcpServers"]["plex-media-server"]["env"]
 
-        required_vars = [
-            "PLEX_URL",
-            "PLEX_TOKEN",
-            "TMDB_API_KEY",
-            "PLEX_MEDIA_ROOT",
-        ]
+        missing = REQUIRED_MCP_ENV_VARS - env.keys()
+        assert not missing, f".mcp.json missing {sorted(missing)}"
 
-        for var in required_vars:
-            assert var in env, f".mcp.json missing {var}"
-
-    def test_skill_md_exists(self):
+    def test_skill_md_exists(self, plugin_tree):
         """SKILL.md should exist."""
-        skill_doc = PLUGIN_ROOT / "SKILL.md"
-        assert skill_doc.exists()
+        assert "SKILL.md" in plugin_tree
 
-    def test_skill_md_not_empty(self):
+    def test_skill_md_not_empty(self, plugin_tree):
         """SKILL.md should have substantial content."""
-        skill_doc = PLUGIN_ROOT / "SKILL.md"
-        content = skill_doc.read_text()
-        assert len(content) > 2000, "SKILL.md is too short"
+        assert plugin_tree["SKILL.md"].stat().st_size > 2000, "SKILL.md is too short"
 
-    def test_skill_md_documents_all_commands(self):
+    def test_skill_md_documents_all_commands(self, skill_md_text):
         """SKILL.md should document all commands."""
-        skill_doc = PLUGIN_ROOT / "SKILL.md"
-        content = skill_doc.read_text()
-
-        commands = ["scan", "identify", "rename", "ingest", "status", "plan", "watch", "review"]
-
-        for cmd in commands:
-            assert f"/plex:{cmd}" in content, f"SKILL.md missing documentation for /plex:{cmd}"
+        mentioned = set(COMMAND_MENTION_RE.findall(skill_md_text))
+        missing = sorted(set(REQUIRED_COMMANDS) - mentioned)
+        assert not missing, \
+            f"SKILL.md missing documentation for /plex: commands {missing}"
 
 
 class TestManifestConsistency:
     """Test consistency between different manifest files."""
 
-    def test_command_files_match_plugin_json(self):
+    def test_command_files_match_plugin_json(self, plugin_manifest, commands_tree):
         """Command files should match commands in plugin.json."""
-        manifest = PLUGIN_ROOT / "plugin.json"
-        with open(manifest) as f:
-            data = json.load(f)
-
-        commands_dir = PLUGIN_ROOT / "commands"
-
-        for cmd in data["commands"]:
-            cmd_name = cmd["name"]
+        for cmd in plugin_manifest["commands"]:
             doc_path = cmd["documentation"]
 
+            # Check file is in commands directory
+            assert doc_path.startswith("commands/"), \
+                f"plugin.json command documentation outside commands/: {doc_path}"
+
             # Check file exists
-            full_path = PLUGIN_ROOT / doc_path
-            assert full_path.exists(), \
+            assert os.path.basename(doc_path) in commands_tree, \
                 f"plugin.json references missing file: {doc_path}"
 
-            # Check file is in commands directory
-            assert full_path.parent == commands_dir
-
-    def test_agent_files_match_plugin_json(self):
+    def test_agent_files_match_plugin_json(self, plugin_manifest, agents_tree):
         """Agent files should match agents in plugin.json."""
-        manifest = PLUGIN_ROOT / "plugin.json"
-        with open(manifest) as f:
-            data = json.load(f)
-
-        agents_dir = PLUGIN_ROOT / "agents"
-
-        for agent in data["agents"]:
-            agent_name = agent["name"]
+        for agent in plugin_manifest["agents"]:
             doc_path = agent["documentation"]
 
+            # Check file is in agents directory
+            assert doc_path.startswith("agents/"), \
+                f"plugin.json agent documentation outside agents/: {doc_path}"
+
             # Check file exists
-            full_path = PLUGIN_ROOT / doc_path
-            assert full_path.exists(), \
+            assert os.path.basename(doc_path) in agents_tree, \
                 f"plugin.json references missing file: {doc_path}"
 
-            # Check file is in agents directory
-            assert full_path.parent == agents_dir
-
-    def test_mcp_server_name_matches(self):
+    def test_mcp_server_name_matches(self, plugin_manifest, mcp_manifest):
         """MCP server name should match between plugin.json and .mcp.json."""
-        plugin_manifest = PLUGIN_ROOT / "plugin.json"
-        with open(plugin_manifest) as f:
-            plugin_data = json.load(f)
-
-        mcp_config = PLUGIN_ROOT / ".mcp.json"
-        with open(mcp_config) as f:
-            mcp_data = json.load(f)
-
-        plugin_server_name = plugin_data["mcp_server"]
-        assert plugin_server_name in mcp_data["mcpServers"], \
+        plugin_server_name = plugin_manifest["mcp_server"]
+        assert plugin_server_name in mcp_manifest["mcpServers"], \
             "MCP server name mismatch between plugin.json and .mcp.json"
 
 
@@ -418,34 +463,16 @@ class TestProjectRootManifest:
 
     def test_root_manifest_exists(self):
         """Root manifest.json should exist."""
-        root_manifest = Path(__file__).parent.parent / "manifest.json"
-        assert root_manifest.exists()
+        assert (PROJECT_ROOT / "manifest.json").exists()
 
-    def test_root_manifest_is_valid_json(self):
+    def test_root_manifest_is_valid_json(self, root_manifest):
         """Root manifest.json should be valid JSON."""
-        root_manifest = Path(__file__).parent.parent / "manifest.json"
-        with open(root_manifest) as f:
-            data = json.load(f)
-        assert isinstance(data, dict)
+        assert isinstance(root_manifest, dict)
 
-    def test_root_manifest_has_server_config(self):
+    def test_root_manifest_has_server_config(self, root_manifest):
         """Root manifest should have server configuration."""
-        root_manifest = Path(__file__).parent.parent / "manifest.json"
-        with open(root_manifest) as f:
-            data = json.load(f)
-
-        required_fields = [
-            "manifest_version",
-            "name",
-            "display_name",
-            "description",
-            "version",
-            "author",
-            "server",
-        ]
-
-        for field in required_fields:
-            assert field in data, f"manifest.json missing {field}"
+        missing = REQUIRED_ROOT_MANIFEST_FIELDS - root_manifest.keys()
+        assert not missing, f"manifest.json missing {sorted(missing)}"
 
 
 if __name__ == "__main__":
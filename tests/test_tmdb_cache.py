@@ -1,5 +1,8 @@
 """Tests for TMDb cache with SQLite backend."""
 
+import asyncio
+import json
+import sqlite3
 import pytest
 import time
 from datetime import datetime, timedelta
@@ -135,6 +138,113 @@ class TestTMDbCache:
         assert result is None
         await cache.close()
 
+    async def test_sweep_expired_removes_rows(self, temp_dir, mock_tmdb_movie_result):
+        """Test that the expiry sweep deletes stale rows in bulk."""
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path, ttl_days=0)
+        await cache.initialize()
+
+        await cache.store("Inception", 2010, "movie", mock_tmdb_movie_result)
+        await cache.store("Interstellar", 2014, "movie", mock_tmdb_movie_result)
+        await cache.flush()
+        time.sleep(0.1)
+
+        # Expired lookups are misses but leave the rows for the sweep
+        assert await cache.get("Inception", 2010, "movie") is None
+        assert (await cache.get_stats())["total_entries"] == 2
+
+        assert await cache.sweep_expired() == 2
+        assert (await cache.get_stats())["total_entries"] == 0
+        await cache.close()
+
+    async def test_new_database_uses_incremental_auto_vacuum(self, temp_dir):
+        """Test a new cache file gets auto_vacuum=INCREMENTAL despite WAL mode."""
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+        await cache.close()
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone() == (2,)
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        conn.close()
+
+    async def test_existing_database_converted_to_incremental_auto_vacuum(self, temp_dir):
+        """Test a WAL cache file created without auto_vacuum is converted on open."""
+        db_path = temp_dir / "tmdb_cache.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE unrelated (x)")
+        conn.close()
+
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+        await cache.close()
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone() == (2,)
+        conn.close()
+
+    async def test_store_many(self, temp_dir, mock_tmdb_movie_result, mock_tmdb_tv_result):
+        """Test bulk store commits every row at once."""
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+
+        await cache.store_many([
+            ("Inception", 2010, "movie", mock_tmdb_movie_result),
+            ("Breaking Bad", 2008, "tv", mock_tmdb_tv_result),
+        ])
+
+        assert not cache._pending_writes
+        stats = await cache.get_stats()
+        assert stats == {"total_entries": 2, "movie_count": 1, "tv_count": 1}
+        await cache.close()
+
+    async def test_get_many(self, temp_dir, mock_tmdb_movie_result, mock_tmdb_tv_result):
+        """Test fetching several entries, including a null year, in one call."""
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+
+        await cache.store("Inception", 2010, "movie", mock_tmdb_movie_result)
+        await cache.store("Breaking Bad", None, "tv", mock_tmdb_tv_result)
+        await cache.close()
+
+        reopened = TMDbCache(db_path)
+        await reopened.initialize()
+        found = await reopened.get_many([
+            ("INCEPTION", 2010, "movie"),
+            ("Breaking Bad", None, "tv"),
+            ("Inception", 2011, "movie"),
+        ])
+
+        assert found == {
+            ("INCEPTION", 2010, "movie"): mock_tmdb_movie_result,
+            ("Breaking Bad", None, "tv"): mock_tmdb_tv_result,
+        }
+        await reopened.close()
+
+    async def test_reads_legacy_text_rows(self, temp_dir, mock_tmdb_movie_result):
+        """Test rows written as JSON text by older versions still decode."""
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+        await cache.close()
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO tmdb_cache VALUES (?, ?, ?, ?, ?)",
+                ("inception", 2010, "movie", json.dumps(mock_tmdb_movie_result),
+                 datetime.now().timestamp()),
+            )
+        conn.close()
+
+        reopened = TMDbCache(db_path)
+        await reopened.initialize()
+        assert await reopened.get("Inception", 2010, "movie") == mock_tmdb_movie_result
+        await reopened.close()
+
     async def test_ttl_not_expired(self, temp_dir, mock_tmdb_movie_result):
         """Test that non-expired cache entries are returned."""
         db_path = temp_dir / "tmdb_cache.db"
@@ -258,3 +368,96 @@ class TestTMDbCache:
         assert stats["tv_count"] >= 1
 
         await cache.close()
+
+    async def test_pending_writes_persist_on_close(self, temp_dir, mock_tmdb_movie_result):
+        """Test that batched writes are flushed to disk when the cache closes."""
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+
+        for i in range(TMDbCache.FLUSH_BATCH_SIZE + 5):
+            await cache.store(f"Movie{i}", 2000, "movie", mock_tmdb_movie_result)
+
+        await cache.close()
+
+        reopened = TMDbCache(db_path)
+        await reopened.initialize()
+
+        stats = await reopened.get_stats()
+        assert stats["total_entries"] == TMDbCache.FLUSH_BATCH_SIZE + 5
+        assert await reopened.get("Movie0", 2000, "movie") is not None
+
+        await reopened.close()
+
+    async def test_close_waits_for_inflight_flush(self, temp_dir, mock_tmdb_movie_result):
+        """Test that closing mid-flush still commits the batch being written."""
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+
+        writing = asyncio.Event()
+        real_executemany = cache._conn.executemany
+
+        async def slow_executemany(*args):
+            writing.set()
+            await asyncio.sleep(0.05)
+            return await real_executemany(*args)
+
+        cache._conn.executemany = slow_executemany
+        await cache.store("Inception", 2010, "movie", mock_tmdb_movie_result)
+        await writing.wait()
+        await cache.close()
+
+        reopened = TMDbCache(db_path)
+        await reopened.initialize()
+        assert await reopened.get("Inception", 2010, "movie") == mock_tmdb_movie_result
+        await reopened.close()
+
+    async def test_memo_serves_repeat_lookups(self, temp_dir, mock_tmdb_movie_result, monkeypatch):
+        """Test that repeat lookups are answered from memory after the first read."""
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+        await cache.store("Inception", 2010, "movie", mock_tmdb_movie_result)
+        await cache.close()
+
+        reopened = TMDbCache(db_path)
+        await reopened.initialize()
+        first = await reopened.get("Inception", 2010, "movie")
+
+        # A memo hit must not touch SQLite at all
+        def fail_acquire(*args, **kwargs):
+            raise AssertionError("memo hit should not query SQLite")
+
+        monkeypatch.setattr(reopened._readers, "acquire", fail_acquire)
+        second = await reopened.get("INCEPTION", 2010, "movie")
+        monkeypatch.undo()
+
+        assert second is first
+        await reopened.clear()
+        assert await reopened.get("Inception", 2010, "movie") is None
+
+        await reopened.close()
+
+    async def test_bloom_filter_skips_unknown_titles(self, temp_dir, mock_tmdb_movie_result, monkeypatch):
+        """Test that titles never stored miss without querying SQLite."""
+        db_path = temp_dir / "tmdb_cache.db"
+        cache = TMDbCache(db_path)
+        await cache.initialize()
+        await cache.store("Inception", 2010, "movie", mock_tmdb_movie_result)
+        await cache.close()
+
+        reopened = TMDbCache(db_path)
+        await reopened.initialize()
+
+        def fail_acquire(*args, **kwargs):
+            raise AssertionError("SQLite queried for an unknown title")
+
+        monkeypatch.setattr(reopened._readers, "acquire", fail_acquire)
+        assert await reopened.get("Memento", 2000, "movie") is None
+        assert await reopened.get_many([("Memento", 2000, "movie")]) == {}
+        monkeypatch.undo()
+
+        # Keys loaded from the table at startup still reach SQLite
+        assert await reopened.get("Inception", 2010, "movie") == mock_tmdb_movie_result
+        await reopened.close()
@@ -8,6 +8,7 @@ from server.tools.media import (
     preview_rename,
     batch_identify
 )
+from server.tools import media
 
 
 @pytest.mark.asyncio
@@ -252,6 +253,15 @@ class TestMediaTools:
             assert result["matched"] == 1
             assert result["failed"] == 1
 
+    async def test_set_matcher_shares_server_matcher(self, monkeypatch):
+        """Test the matcher installed at startup is the one the tools use."""
+        monkeypatch.setattr(media, "_matcher", None)
+        server_matcher = MagicMock()
+
+        media.set_matcher(server_matcher)
+
+        assert media.get_matcher() is server_matcher
+
     async def test_batch_identify_tool_empty_list(self):
         """Test batch_identify tool with empty filename list."""
         result = await batch_identify(filenames=[])
@@ -36,9 +36,8 @@ def file_manager(temp_media_root, temp_ingest_dir):
 @pytest.fixture
 async def history_db(temp_db):
     """Create initialized IngestHistory."""
-    history = IngestHistory(db_path=temp_db)
-    await history.initialize()
-    return history
+    async with IngestHistory(db_path=temp_db) as history:
+        yield history
 
 
 # =============================================================================